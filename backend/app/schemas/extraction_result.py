@@ -4,6 +4,7 @@ Pydantic schemas for PDF extraction results.
 These schemas define the structure of data returned by the PDF extraction service.
 """
 
+from functools import cached_property
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -166,16 +167,32 @@ class ExtractionResult(BaseModel):
     extracted_at: datetime = Field(default_factory=datetime.utcnow, description="Extraction timestamp")
     cleaning_metadata: Optional[CleaningMetadata] = Field(default=None, description="Text cleaning metadata")
     
-    @property
+    @cached_property
     def total_char_count(self) -> int:
-        """Total character count across all pages."""
+        """Total character count across all pages.
+        
+        Summed from the per-page counts (never recounted from the combined
+        text) and computed once, since the result is immutable.
+        """
         return sum(page.char_count for page in self.pages)
     
-    @property
+    @cached_property
     def total_word_count(self) -> int:
-        """Total word count across all pages."""
+        """Total word count across all pages.
+        
+        Summed from the per-page counts and computed once.
+        """
         return sum(page.word_count for page in self.pages)
     
+    @cached_property
+    def total_text_blocks(self) -> int:
+        """Total number of positioned text blocks across all pages.
+        
+        Counted once, so callers that only need the count don't walk every
+        page's block list themselves.
+        """
+        return sum(len(page.text_blocks) for page in self.pages)
+    
     @property
     def success_rate(self) -> float:
         """Percentage of pages successfully extracted."""
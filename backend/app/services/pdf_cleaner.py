@@ -16,6 +16,44 @@ from app.schemas.extraction_result import (
 )
 
 
+# Case-insensitive "Page X of Y" marker, shared by footer checks
+_PAGE_X_OF_Y_RE = re.compile(r'Page\s+\d+\s+of\s+\d+', re.IGNORECASE)
+
+# Standalone page number lines (case-insensitive), matched against stripped lines
+_PAGE_NUMBER_RE = re.compile(
+    r'^\s*Page\s+\d+\s*$'  # "Page 1"
+    r'|^\s*Page\s+\d+\s+of\s+\d+\s*$'  # "Page 1 of 10"
+    r'|^\s*\d+\s+of\s+\d+\s*$'  # "1 of 10"
+    r'|^\s*[-–—]\s*\d+\s*[-–—]\s*$'  # "- 5 -"
+    r'|^\s*[ivxlcdm]{2,}\s*$',  # Roman numerals (ii, iii, etc.; single letters are too ambiguous)
+    re.IGNORECASE,
+)
+
+# Lines consisting entirely of formatting remnants
+_FORMATTING_RE = re.compile(
+    r'^\s*[•\-\*◦▪▫]\s*$'  # Orphaned bullets
+    r'|^[\|─┼├┤┬┴┌┐└┘│]+$'  # Table borders
+    r'|^[\.,:;!?]{3,}$'  # Excessive punctuation
+)
+
+# Excessive punctuation trailing a line
+_TRAILING_ELLIPSIS_RE = re.compile(r'\.{3,}$')
+_TRAILING_PUNCTUATION_RE = re.compile(r'[,:;!?]{3,}$')
+
+
+def _collapse_blank_lines(text: str) -> str:
+    """
+    Collapse every run of three or more newlines to exactly two.
+    
+    Uses plain str.replace: each pass at least halves the longest run, so
+    this finishes in O(log max_run) passes and the common case (no such
+    runs) is two substring scans.
+    """
+    while '\n\n\n\n' in text:
+        text = text.replace('\n\n\n\n', '\n\n')
+    return text.replace('\n\n\n', '\n\n')
+
+
 class PDFCleaner:
     """
     PDF text cleaning service for removing noise while preserving semantic content.
@@ -29,21 +67,9 @@ class PDFCleaner:
     
     def __init__(self):
         """Initialize the PDF cleaner."""
-        # Page number patterns
-        self.page_number_patterns = [
-            r'^\s*Page\s+\d+\s*$',  # "Page 1"
-            r'^\s*Page\s+\d+\s+of\s+\d+\s*$',  # "Page 1 of 10"
-            r'^\s*\d+\s+of\s+\d+\s*$',  # "1 of 10"
-            r'^\s*[-–—]\s*\d+\s*[-–—]\s*$',  # "- 5 -"
-            r'^\s*[ivxlcdm]+\s*$',  # Roman numerals (i, ii, iii, etc.)
-        ]
-        
-        # Formatting remnant patterns
-        self.formatting_patterns = [
-            r'^\s*[•\-\*◦▪▫]\s*$',  # Orphaned bullets
-            r'^[\|─┼├┤┬┴┌┐└┘│]+$',  # Table borders
-            r'^[\.,:;!?]{3,}$',  # Excessive punctuation
-        ]
+        # Patterns are compiled once at module level
+        self.page_number_pattern = _PAGE_NUMBER_RE
+        self.formatting_pattern = _FORMATTING_RE
     
     def detect_headers_footers(self, pages: List[PageResult]) -> Dict[str, List[str]]:
         """
@@ -174,7 +200,7 @@ class PDFCleaner:
         if footers:
             for footer in footers:
                 # Look for "Page X of Y" pattern in footer
-                matches = re.findall(r'Page\s+\d+\s+of\s+\d+', footer, re.IGNORECASE)
+                matches = _PAGE_X_OF_Y_RE.findall(footer)
                 page_numbers.extend(matches)
         
         # Then look for standalone page numbers in text
@@ -186,16 +212,9 @@ class PDFCleaner:
                 continue
             
             # Check against page number patterns
-            # Skip single-letter roman numerals to avoid false positives
-            for pattern in self.page_number_patterns:
-                if pattern == r'^\s*[ivxlcdm]+\s*$':
-                    # Only match roman numerals if they're 2+ characters
-                    if re.match(r'^\s*[ivxlcdm]{2,}\s*$', line_stripped, re.IGNORECASE):
-                        page_numbers.append(line_stripped)
-                        break
-                elif re.match(pattern, line_stripped, re.IGNORECASE):
-                    page_numbers.append(line_stripped)
-                    break
+            # (single-letter roman numerals are skipped to avoid false positives)
+            if self.page_number_pattern.match(line_stripped):
+                page_numbers.append(line_stripped)
         
         return page_numbers
     
@@ -279,18 +298,11 @@ class PDFCleaner:
                 cleaned_lines.append(line)
                 continue
             
-            # Check if line matches any formatting pattern (entire line is formatting)
-            is_formatting = False
-            for pattern in self.formatting_patterns:
-                if re.match(pattern, line_stripped):
-                    is_formatting = True
-                    break
-            
-            # Keep line if it's not just formatting
-            if not is_formatting:
+            # Keep line if it's not just formatting (entire line is formatting)
+            if not self.formatting_pattern.match(line_stripped):
                 # Remove excessive punctuation at end of line
-                line_stripped = re.sub(r'\.{3,}$', '', line_stripped)
-                line_stripped = re.sub(r'[,:;!?]{3,}$', '', line_stripped)
+                line_stripped = _TRAILING_ELLIPSIS_RE.sub('', line_stripped)
+                line_stripped = _TRAILING_PUNCTUATION_RE.sub('', line_stripped)
                 cleaned_lines.append(line_stripped)
         
         return '\n'.join(cleaned_lines)
@@ -351,7 +363,7 @@ class PDFCleaner:
                 footers_to_remove = []
                 for footer in footers_removed:
                     # Check if footer contains page number pattern
-                    if re.search(r'Page\s+\d+\s+of\s+\d+', footer, re.IGNORECASE):
+                    if _PAGE_X_OF_Y_RE.search(footer):
                         footers_to_keep.append(footer)
                     else:
                         footers_to_remove.append(footer)
@@ -417,7 +429,7 @@ class PDFCleaner:
         
         # 5. Final cleanup - normalize excessive whitespace
         # Remove multiple blank lines
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = _collapse_blank_lines(cleaned)
         # Remove trailing whitespace from lines
         lines = cleaned.split('\n')
         cleaned = '\n'.join(line.rstrip() for line in lines)
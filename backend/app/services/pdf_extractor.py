@@ -4,7 +4,13 @@ PDF text extraction service.
 Provides robust PDF text extraction with multiple strategies and fallback mechanisms.
 """
 
+import hashlib
+import io
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Union, List, Optional
 import fitz  # PyMuPDF
@@ -24,22 +30,277 @@ from app.services.pdf_normalizer import PDFNormalizer
 from app.services.pdf_cleaner import PDFCleaner
 
 
+# Maximum number of extraction results kept per extractor instance
+RESULT_CACHE_SIZE = 32
+
+# Files larger than this (in bytes) are not hashed for the content cache on a
+# path-cache miss; reading them twice would cost more than a rare duplicate
+CONTENT_DIGEST_MAX_BYTES = 16 * 1024 * 1024
+
+# Text extraction flags: the "dict" defaults minus embedded image data
+_TEXT_DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Documents with more pages than this are extracted in worker processes
+PARALLEL_PAGE_THRESHOLD = 200
+
+# Number of consecutive pages each worker process extracts per task
+PAGES_PER_WORKER_TASK = 50
+
+
+def _extract_pymupdf_pages(
+    doc: "fitz.Document",
+    page_numbers: range,
+    normalizer: PDFNormalizer
+) -> tuple[List[PageResult], List[str]]:
+    """
+    Extract a range of pages from an open PyMuPDF document.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_numbers: Zero-based page indices to extract
+        normalizer: Normalizer applied to each page's text
+        
+    Returns:
+        Tuple of (page_results, errors) where errors holds one message per
+        page that failed to extract
+    """
+    pages = []
+    errors = []
+    
+    for page_num in page_numbers:
+        try:
+            page = doc[page_num]
+            
+            # Extract text with position information
+            # Image blocks are excluded so their binary content is never
+            # copied into Python objects; only text spans are used here
+            text_dict = page.get_text("dict", flags=_TEXT_DICT_FLAGS)
+            blocks = text_dict.get("blocks", [])
+            
+            # Extract text blocks with coordinates. Sort keys are kept in a
+            # parallel list built from the raw bbox floats, so ordering never
+            # touches model attributes.
+            text_blocks = []
+            sort_keys = []
+            raw_text_parts = []
+            
+            for block in blocks:
+                if block.get("type") == 0:  # Text block
+                    for line in block.get("lines", []):
+                        for span in line.get("spans", []):
+                            text = span.get("text", "")
+                            if text.strip():
+                                bbox = span.get("bbox", [0, 0, 0, 0])
+                                text_block = TextBlock(
+                                    text=text,
+                                    page_number=page_num + 1,
+                                    x0=bbox[0],
+                                    y0=bbox[1],
+                                    x1=bbox[2],
+                                    y1=bbox[3],
+                                    font_name=span.get("font"),
+                                    font_size=span.get("size"),
+                                )
+                                text_blocks.append(text_block)
+                                sort_keys.append((-bbox[3], bbox[0]))
+                                raw_text_parts.append(text)
+            
+            # Sort text blocks by position (top to bottom, left to right)
+            order = sorted(range(len(text_blocks)), key=sort_keys.__getitem__)
+            text_blocks = [text_blocks[i] for i in order]
+            
+            # Combine text
+            raw_text = " ".join(raw_text_parts)
+            normalized_text = normalizer.normalize_text(raw_text)
+            
+            # Count words and characters
+            char_count = len(normalized_text)
+            word_count = len(normalized_text.split())
+            
+            # Check for images
+            has_images = bool(page.get_image_info())
+            
+            page_result = PageResult(
+                page_number=page_num + 1,
+                text=normalized_text,
+                raw_text=raw_text,
+                text_blocks=text_blocks,
+                char_count=char_count,
+                word_count=word_count,
+                extraction_method=ExtractionMethod.PYMUPDF,
+                has_images=has_images,
+                warnings=[],
+                errors=[],
+            )
+            
+            pages.append(page_result)
+            
+        except Exception as e:
+            errors.append(f"Page {page_num + 1}: {str(e)}")
+    
+    return pages, errors
+
+
+def _cache_get(
+    cache: OrderedDict[tuple, ExtractionResult],
+    key: tuple
+) -> Optional[ExtractionResult]:
+    """
+    Look up a result in an LRU cache, marking it as recently used.
+    
+    The caller must hold the cache lock.
+    
+    Args:
+        cache: Cache to read
+        key: Cache key
+        
+    Returns:
+        Cached result, or None on a miss
+    """
+    result = cache.get(key)
+    if result is not None:
+        cache.move_to_end(key)
+    return result
+
+
+def _cache_put(
+    cache: OrderedDict[tuple, ExtractionResult],
+    key: tuple,
+    result: ExtractionResult
+) -> None:
+    """
+    Store a result in an LRU cache, evicting the oldest entry if full.
+    
+    The caller must hold the cache lock.
+    
+    Args:
+        cache: Cache to update
+        key: Cache key
+        result: Extraction result to store
+    """
+    cache[key] = result
+    if len(cache) > RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _open_pymupdf(source: Union[str, os.PathLike, bytes]) -> "fitz.Document":
+    """
+    Open a PDF with PyMuPDF from a file path or in-memory bytes.
+    
+    Args:
+        source: Path to the PDF file, or the file's contents
+        
+    Returns:
+        Open PyMuPDF document
+    """
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _extract_pymupdf_page_range(
+    source: Union[str, bytes],
+    start: int,
+    stop: int
+) -> tuple[List[PageResult], List[str]]:
+    """
+    Worker entry point: extract pages [start, stop) from a PDF.
+    
+    Opens its own document handle since PyMuPDF documents cannot be shared
+    between processes.
+    
+    Args:
+        source: Path to PDF file, or the file's contents
+        start: First zero-based page index
+        stop: Page index to stop before
+        
+    Returns:
+        Tuple of (page_results, errors)
+    """
+    with _open_pymupdf(source) as doc:
+        return _extract_pymupdf_pages(doc, range(start, stop), PDFNormalizer())
+
+
+def _stat_pdf(pdf_path: Union[str, os.PathLike]) -> tuple[Path, os.stat_result]:
+    """
+    Validate a PDF path argument and stat the file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Tuple of (path, stat result)
+        
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        TypeError: If pdf_path is not a string or Path
+    """
+    # Validate input type
+    if not isinstance(pdf_path, (str, os.PathLike)):
+        raise TypeError(f"pdf_path must be str or Path, got {type(pdf_path)}")
+    
+    pdf_path = Path(pdf_path)
+    
+    # Check file exists (a single stat also provides the cache key)
+    try:
+        return pdf_path, pdf_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}") from None
+
+
+def _extract_text_worker(
+    pdf_path: str,
+    file_size: int,
+    apply_cleaning: bool,
+    cleaning_options: Optional[CleaningOptions]
+) -> ExtractionResult:
+    """
+    Worker entry point: extract one PDF file in a pool process.
+    
+    Args:
+        pdf_path: Path to PDF file
+        file_size: File size in bytes
+        apply_cleaning: Whether to apply text cleaning
+        cleaning_options: Cleaning configuration
+        
+    Returns:
+        ExtractionResult for the file
+    """
+    return PDFExtractor()._extract_uncached(
+        Path(pdf_path), file_size, apply_cleaning, cleaning_options
+    )
+
+
 class PDFExtractor:
     """
     PDF text extraction service with multi-strategy approach.
     
     Uses PyMuPDF as primary extraction method with pdfplumber as fallback.
     Handles reading order preservation, encoding issues, and error recovery.
+    
+    Successful results are cached per file path, modification time, size and
+    cleaning settings, so re-extracting an unchanged file is a dictionary
+    lookup. On a miss, results are also looked up by a digest of the file
+    contents, so copies of the same PDF (e.g. repeated uploads under new
+    temporary names) are extracted once; files over CONTENT_DIGEST_MAX_BYTES
+    skip that lookup. Results are immutable and safe to share between
+    callers, and the caches are guarded by a lock, so one extractor can
+    serve several threads. A cached result is returned as-is, so its
+    ``extracted_at`` and ``metadata.processing_time_ms`` describe the original
+    extraction, not the call that returned it.
     """
     
     def __init__(self):
         """Initialize the PDF extractor."""
         self.normalizer = PDFNormalizer()
         self.cleaner = PDFCleaner()
+        self._result_cache: OrderedDict[tuple, ExtractionResult] = OrderedDict()
+        self._content_cache: OrderedDict[tuple, ExtractionResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def extract_text(
         self,
-        pdf_path: Union[str, Path],
+        pdf_path: Union[str, os.PathLike],
         apply_cleaning: bool = True,
         cleaning_options: Optional[CleaningOptions] = None
     ) -> ExtractionResult:
@@ -52,57 +313,277 @@ class PDFExtractor:
             cleaning_options: Optional cleaning configuration
             
         Returns:
-            ExtractionResult with extracted text and metadata
+            ExtractionResult with extracted text and metadata. Cached results
+            keep the timing and timestamp of the original extraction.
             
         Raises:
             FileNotFoundError: If PDF file doesn't exist
             TypeError: If pdf_path is not a string or Path
         """
-        # Validate input type
-        if not isinstance(pdf_path, (str, Path)):
-            raise TypeError(f"pdf_path must be str or Path, got {type(pdf_path)}")
+        pdf_path, stat_result = _stat_pdf(pdf_path)
         
-        pdf_path = Path(pdf_path)
+        if cleaning_options is None and apply_cleaning:
+            cleaning_options = CleaningOptions()
         
-        # Check file exists
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        cached, cache_key, content_key = self._lookup_cached(
+            pdf_path, stat_result, apply_cleaning, cleaning_options
+        )
+        if cached is not None:
+            return cached
         
-        # Start timing
-        start_time = time.time()
+        result = self._extract_uncached(
+            pdf_path, stat_result.st_size, apply_cleaning, cleaning_options
+        )
+        self._store_cached(cache_key, content_key, result)
+        return result
+    
+    def extract_text_from_bytes(
+        self,
+        data: bytes,
+        apply_cleaning: bool = True,
+        cleaning_options: Optional[CleaningOptions] = None
+    ) -> ExtractionResult:
+        """
+        Extract text from a PDF held in memory.
+        
+        Useful when the document is already loaded (e.g. an upload body), as
+        nothing is written to or read from disk. Results share the content
+        cache with extract_text, so bytes of a file that was already
+        extracted (or vice versa) are served from the cache.
+        
+        Args:
+            data: Contents of the PDF file
+            apply_cleaning: Whether to apply text cleaning (default: True)
+            cleaning_options: Optional cleaning configuration
+            
+        Returns:
+            ExtractionResult with extracted text and metadata
+            
+        Raises:
+            TypeError: If data is not bytes
+        """
+        if not isinstance(data, bytes):
+            raise TypeError(f"data must be bytes, got {type(data)}")
+        
+        if cleaning_options is None and apply_cleaning:
+            cleaning_options = CleaningOptions()
+        
+        content_key = (hashlib.blake2b(data).digest(), apply_cleaning, cleaning_options)
+        with self._cache_lock:
+            cached = _cache_get(self._content_cache, content_key)
+        if cached is not None:
+            return cached
+        
+        result = self._extract_uncached(data, len(data), apply_cleaning, cleaning_options)
+        if result.status != ExtractionStatus.FAILED:
+            with self._cache_lock:
+                _cache_put(self._content_cache, content_key, result)
+        return result
+    
+    def extract_text_many(
+        self,
+        pdf_paths: List[Union[str, os.PathLike]],
+        apply_cleaning: bool = True,
+        cleaning_options: Optional[CleaningOptions] = None,
+        max_workers: Optional[int] = None
+    ) -> List[ExtractionResult]:
+        """
+        Extract text from several PDF files, in parallel across processes.
+        
+        Extraction is CPU-bound and PyMuPDF is not thread-safe, so files that
+        miss the cache are extracted in worker processes; cached files and
+        batches with a single uncached file are handled inline. Each unique
+        file is extracted once, however often (or under however many paths)
+        it appears in the batch.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            apply_cleaning: Whether to apply text cleaning (default: True)
+            cleaning_options: Optional cleaning configuration
+            max_workers: Maximum worker processes (default: CPU count)
+            
+        Returns:
+            List of ExtractionResult objects in input order
+            
+        Raises:
+            FileNotFoundError: If any PDF file doesn't exist
+            TypeError: If any path is not a string or Path
+        """
+        if cleaning_options is None and apply_cleaning:
+            cleaning_options = CleaningOptions()
+        
+        # Validate every path up front so a bad path fails before any work
+        requests = [_stat_pdf(pdf_path) for pdf_path in pdf_paths]
+        
+        results: List[Optional[ExtractionResult]] = [None] * len(requests)
+        pending: List[tuple[tuple, Path, int, tuple, Optional[tuple]]] = []
+        waiting: dict[tuple, List[int]] = {}
+        
+        for index, (pdf_path, stat_result) in enumerate(requests):
+            cached, cache_key, content_key = self._lookup_cached(
+                pdf_path, stat_result, apply_cleaning, cleaning_options
+            )
+            if cached is not None:
+                results[index] = cached
+                continue
+            
+            # Repeated paths and byte-identical copies are extracted once
+            work_key = content_key or cache_key
+            if work_key in waiting:
+                waiting[work_key].append(index)
+            else:
+                waiting[work_key] = [index]
+                pending.append((work_key, pdf_path, stat_result.st_size, cache_key, content_key))
+        
+        if len(pending) == 1:
+            _, pdf_path, file_size, _, _ = pending[0]
+            extracted = [self._extract_uncached(pdf_path, file_size, apply_cleaning, cleaning_options)]
+        elif pending:
+            max_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields results in submission order
+                extracted = list(executor.map(
+                    _extract_text_worker,
+                    [os.fspath(item[1]) for item in pending],
+                    [item[2] for item in pending],
+                    [apply_cleaning] * len(pending),
+                    [cleaning_options] * len(pending),
+                ))
+        else:
+            extracted = []
+        
+        for (work_key, _, _, cache_key, content_key), result in zip(pending, extracted):
+            self._store_cached(cache_key, content_key, result)
+            for index in waiting[work_key]:
+                results[index] = result
+        
+        return results
+    
+    def _lookup_cached(
+        self,
+        pdf_path: Path,
+        stat_result: os.stat_result,
+        apply_cleaning: bool,
+        cleaning_options: Optional[CleaningOptions]
+    ) -> tuple[Optional[ExtractionResult], tuple, Optional[tuple]]:
+        """
+        Look up a cached result by path and stat, then by file contents.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            stat_result: Result of stat() on the file
+            apply_cleaning: Whether text cleaning is applied
+            cleaning_options: Cleaning configuration
+            
+        Returns:
+            Tuple of (cached result or None, path cache key, content cache key
+            or None if the file was too large or could not be read)
+        """
+        # abspath is purely lexical, unlike resolve() which stats each
+        # path component
+        cache_key = (
+            os.path.abspath(pdf_path),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            apply_cleaning,
+            cleaning_options,
+        )
+        with self._cache_lock:
+            cached = _cache_get(self._result_cache, cache_key)
+        if cached is not None:
+            return cached, cache_key, None
+        
+        # Fall back to the file contents, which catch copies of a known file;
+        # hashing happens outside the lock
+        if stat_result.st_size > CONTENT_DIGEST_MAX_BYTES:
+            return None, cache_key, None
+        try:
+            with open(pdf_path, "rb") as f:
+                digest = hashlib.file_digest(f, "blake2b").digest()
+        except OSError:
+            # Unreadable files fail (and are reported) during extraction
+            return None, cache_key, None
+        content_key = (digest, apply_cleaning, cleaning_options)
+        
+        with self._cache_lock:
+            cached = _cache_get(self._content_cache, content_key)
+            if cached is not None:
+                _cache_put(self._result_cache, cache_key, cached)
+        
+        return cached, cache_key, content_key
+    
+    def _store_cached(
+        self,
+        cache_key: tuple,
+        content_key: Optional[tuple],
+        result: ExtractionResult
+    ) -> None:
+        """
+        Cache a freshly extracted result unless extraction failed.
         
-        # Get file size
-        file_size = pdf_path.stat().st_size
+        Args:
+            cache_key: Path cache key
+            content_key: Content cache key, if the file could be read
+            result: Extraction result
+        """
+        # Cache the result, evicting the least recently used entry if full
+        if result.status != ExtractionStatus.FAILED:
+            with self._cache_lock:
+                _cache_put(self._result_cache, cache_key, result)
+                if content_key is not None:
+                    _cache_put(self._content_cache, content_key, result)
+    
+    def _extract_uncached(
+        self,
+        source: Union[Path, bytes],
+        file_size: int,
+        apply_cleaning: bool,
+        cleaning_options: Optional[CleaningOptions]
+    ) -> ExtractionResult:
+        """
+        Run the extraction pipeline on a PDF, bypassing the caches.
+        
+        Args:
+            source: Path to the PDF file, or the file's contents
+            file_size: File size in bytes
+            apply_cleaning: Whether to apply text cleaning
+            cleaning_options: Cleaning configuration
+            
+        Returns:
+            ExtractionResult with extracted text and metadata
+        """
+        # Start timing
+        start_time = time.perf_counter()
         
         # Try primary extraction method (PyMuPDF)
         try:
-            pages, metadata = self._extract_with_pymupdf(pdf_path)
+            pages, metadata = self._extract_with_pymupdf(source)
             extraction_method = ExtractionMethod.PYMUPDF
             fallback_used = False
         except Exception as e:
             # Fallback to pdfplumber
             try:
-                pages, metadata = self._extract_with_pdfplumber(pdf_path)
+                pages, metadata = self._extract_with_pdfplumber(source)
                 extraction_method = ExtractionMethod.PDFPLUMBER
                 fallback_used = True
                 metadata.warnings.append(f"PyMuPDF extraction failed, used pdfplumber: {str(e)}")
             except Exception as e2:
                 # Both methods failed
-                return self._create_failed_result(pdf_path, file_size, start_time, str(e2))
+                return self._create_failed_result(source, file_size, start_time, str(e2))
         
         # Calculate processing time
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
         
-        # Combine all page text
+        # Combine all page text. Each page is already normalized and pages are
+        # joined by a paragraph break, so joining the non-empty page texts is
+        # equivalent to normalizing the combined raw text again.
         raw_text = "\n\n".join(page.raw_text for page in pages)
-        normalized_text = self.normalizer.normalize_text(raw_text)
+        normalized_text = "\n\n".join(page.text for page in pages if page.text)
         
         # Apply cleaning if enabled
         cleaning_metadata = None
         final_text = normalized_text
         if apply_cleaning:
-            if cleaning_options is None:
-                cleaning_options = CleaningOptions()
             final_text, cleaning_metadata = self.cleaner.clean_text_with_metadata(
                 normalized_text,
                 pages,
@@ -140,111 +621,90 @@ class PDFExtractor:
             cleaning_metadata=cleaning_metadata,
         )
     
-    def _extract_with_pymupdf(self, pdf_path: Path) -> tuple[List[PageResult], ExtractionMetadata]:
+    def _extract_with_pymupdf(self, source: Union[Path, bytes]) -> tuple[List[PageResult], ExtractionMetadata]:
         """
         Extract text using PyMuPDF (fitz).
         
+        Documents with more than PARALLEL_PAGE_THRESHOLD pages are split into
+        page ranges extracted in worker processes. PyMuPDF is not thread-safe,
+        so each worker opens its own copy of the document. Pages are returned
+        in document order either way.
+        
         Args:
-            pdf_path: Path to PDF file
+            source: Path to PDF file, or the file's contents
             
         Returns:
             Tuple of (page_results, metadata)
         """
-        doc = fitz.open(pdf_path)
-        pages = []
-        warnings = []
-        errors = []
-        pages_extracted = 0
-        pages_failed = 0
-        
-        for page_num in range(len(doc)):
-            try:
-                page = doc[page_num]
-                
-                # Extract text with position information
-                text_dict = page.get_text("dict")
-                blocks = text_dict.get("blocks", [])
-                
-                # Extract text blocks with coordinates
-                text_blocks = []
-                raw_text_parts = []
-                
-                for block in blocks:
-                    if block.get("type") == 0:  # Text block
-                        for line in block.get("lines", []):
-                            for span in line.get("spans", []):
-                                text = span.get("text", "")
-                                if text.strip():
-                                    bbox = span.get("bbox", [0, 0, 0, 0])
-                                    text_block = TextBlock(
-                                        text=text,
-                                        page_number=page_num + 1,
-                                        x0=bbox[0],
-                                        y0=bbox[1],
-                                        x1=bbox[2],
-                                        y1=bbox[3],
-                                        font_name=span.get("font"),
-                                        font_size=span.get("size"),
-                                    )
-                                    text_blocks.append(text_block)
-                                    raw_text_parts.append(text)
-                
-                # Sort text blocks by position (top to bottom, left to right)
-                text_blocks.sort(key=lambda b: (-b.y1, b.x0))
-                
-                # Combine text
-                raw_text = " ".join(raw_text_parts)
-                normalized_text = self.normalizer.normalize_text(raw_text)
-                
-                # Count words and characters
-                char_count = len(normalized_text)
-                word_count = len(normalized_text.split())
-                
-                # Check for images
-                has_images = any(block.get("type") == 1 for block in blocks)
-                
-                page_result = PageResult(
-                    page_number=page_num + 1,
-                    text=normalized_text,
-                    raw_text=raw_text,
-                    text_blocks=text_blocks,
-                    char_count=char_count,
-                    word_count=word_count,
-                    extraction_method=ExtractionMethod.PYMUPDF,
-                    has_images=has_images,
-                    warnings=[],
-                    errors=[],
+        doc = _open_pymupdf(source)
+        try:
+            total_pages = len(doc)
+            if total_pages <= PARALLEL_PAGE_THRESHOLD:
+                pages, errors = _extract_pymupdf_pages(
+                    doc, range(total_pages), self.normalizer
                 )
-                
-                pages.append(page_result)
-                pages_extracted += 1
-                
-            except Exception as e:
-                pages_failed += 1
-                errors.append(f"Page {page_num + 1}: {str(e)}")
+        finally:
+            doc.close()
         
-        doc.close()
+        if total_pages > PARALLEL_PAGE_THRESHOLD:
+            pages, errors = self._extract_pymupdf_parallel(source, total_pages)
         
         metadata = ExtractionMetadata(
-            total_pages=len(doc),
-            pages_extracted=pages_extracted,
-            pages_failed=pages_failed,
+            total_pages=total_pages,
+            pages_extracted=len(pages),
+            pages_failed=len(errors),
             extraction_method=ExtractionMethod.PYMUPDF,
             fallback_used=False,
             processing_time_ms=0,  # Will be set later
             file_size_bytes=0,  # Will be set later
-            warnings=warnings,
+            warnings=[],
             errors=errors,
         )
         
         return pages, metadata
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> tuple[List[PageResult], ExtractionMetadata]:
+    def _extract_pymupdf_parallel(
+        self,
+        source: Union[Path, bytes],
+        total_pages: int
+    ) -> tuple[List[PageResult], List[str]]:
+        """
+        Extract pages of a large document across worker processes.
+        
+        Args:
+            source: Path to PDF file, or the file's contents
+            total_pages: Number of pages in the document
+            
+        Returns:
+            Tuple of (page_results, errors) in page order
+        """
+        starts = range(0, total_pages, PAGES_PER_WORKER_TASK)
+        stops = [min(start + PAGES_PER_WORKER_TASK, total_pages) for start in starts]
+        max_workers = min(os.cpu_count() or 1, len(starts))
+        worker_source = source if isinstance(source, bytes) else os.fspath(source)
+        
+        pages: List[PageResult] = []
+        errors: List[str] = []
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in submission order, preserving page order
+            for range_pages, range_errors in executor.map(
+                _extract_pymupdf_page_range,
+                [worker_source] * len(starts),
+                starts,
+                stops,
+            ):
+                pages.extend(range_pages)
+                errors.extend(range_errors)
+        
+        return pages, errors
+    
+    def _extract_with_pdfplumber(self, source: Union[Path, bytes]) -> tuple[List[PageResult], ExtractionMetadata]:
         """
         Extract text using pdfplumber (fallback method).
         
         Args:
-            pdf_path: Path to PDF file
+            source: Path to PDF file, or the file's contents
             
         Returns:
             Tuple of (page_results, metadata)
@@ -255,7 +715,10 @@ class PDFExtractor:
         pages_extracted = 0
         pages_failed = 0
         
-        with pdfplumber.open(pdf_path) as pdf:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        
+        with pdfplumber.open(source) as pdf:
             total_pages = len(pdf.pages)
             
             for page_num, page in enumerate(pdf.pages, start=1):
@@ -322,7 +785,7 @@ class PDFExtractor:
     
     def _create_failed_result(
         self,
-        pdf_path: Path,
+        source: Union[Path, bytes],
         file_size: int,
         start_time: float,
         error_message: str
@@ -331,7 +794,7 @@ class PDFExtractor:
         Create a failed extraction result.
         
         Args:
-            pdf_path: Path to PDF file
+            source: Path to PDF file, or the file's contents
             file_size: File size in bytes
             start_time: Start time of extraction
             error_message: Error message
@@ -339,7 +802,7 @@ class PDFExtractor:
         Returns:
             ExtractionResult with failed status
         """
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
         
         metadata = ExtractionMetadata(
             total_pages=0,
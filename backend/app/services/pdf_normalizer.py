@@ -9,27 +9,70 @@ import unicodedata
 from typing import Optional
 
 
+# Smart quote mappings
+_QUOTE_MAP = {
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u2032': "'",  # Prime
+    '\u2033': '"',  # Double prime
+}
+
+# Dash mappings
+_DASH_MAP = {
+    '\u2013': '-',  # En dash
+    '\u2014': '--',  # Em dash
+    '\u2015': '--',  # Horizontal bar
+}
+
+# Invisible characters that PDF extraction leaves in text, deleted outright.
+# Zero-width (non-)joiners are kept since they affect shaping in some scripts.
+_DROP_CHARS = {
+    '\u200b': None,  # Zero-width space
+    '\ufeff': None,  # Byte order mark / zero-width no-break space
+    '\u00ad': None,  # Soft hyphen
+}
+
+# Single translation table applying all mappings in one pass
+_SPECIAL_CHAR_TABLE = str.maketrans({**_QUOTE_MAP, **_DASH_MAP, **_DROP_CHARS})
+
+# Runs of spaces/tabs that need rewriting to a single space. Lone spaces are
+# not matched, so the common case produces no substitutions at all.
+_SPACE_RUN_RE = re.compile(r'\t[ \t]*| [ \t]+')
+
+# Whitespace runs containing at least one newline
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# Matches any whitespace that normalize_whitespace() would rewrite. Leading and
+# trailing whitespace is checked separately.
+_WHITESPACE_WORK_RE = re.compile(r'[\t\r]| {2}|[^\S\n]\n|\n[^\S\n]|\n{3}')
+
+
+def _needs_whitespace_work(text: str) -> bool:
+    """Check whether normalize_whitespace() would change non-empty text."""
+    return (
+        text[0].isspace()
+        or text[-1].isspace()
+        or _WHITESPACE_WORK_RE.search(text) is not None
+    )
+
+
+def _collapse_line_break(match: re.Match) -> str:
+    """Replace a whitespace run containing newlines with one or two newlines."""
+    return '\n\n' if match.group().count('\n') > 1 else '\n'
+
+
 class PDFNormalizer:
     """Utility class for normalizing extracted PDF text."""
     
     def __init__(self):
         """Initialize the normalizer."""
         # Smart quote mappings
-        self.quote_map = {
-            '\u201c': '"',  # Left double quotation mark
-            '\u201d': '"',  # Right double quotation mark
-            '\u2018': "'",  # Left single quotation mark
-            '\u2019': "'",  # Right single quotation mark
-            '\u2032': "'",  # Prime
-            '\u2033': '"',  # Double prime
-        }
+        self.quote_map = _QUOTE_MAP
         
         # Dash mappings
-        self.dash_map = {
-            '\u2013': '-',  # En dash
-            '\u2014': '--',  # Em dash
-            '\u2015': '--',  # Horizontal bar
-        }
+        self.dash_map = _DASH_MAP
     
     def normalize_whitespace(self, text: str) -> str:
         """
@@ -50,28 +93,20 @@ class PDFNormalizer:
         if not text:
             return ""
         
+        # Fast path: already-normalized text is returned unchanged
+        if not _needs_whitespace_work(text):
+            return text
+        
         # Convert carriage returns to newlines
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Convert tabs to spaces
-        text = text.replace('\t', ' ')
-        
-        # Collapse multiple spaces to single space (but preserve newlines)
-        lines = text.split('\n')
-        normalized_lines = []
-        
-        for line in lines:
-            # Collapse multiple spaces within line
-            line = re.sub(r' +', ' ', line)
-            # Remove leading/trailing whitespace from line
-            line = line.strip()
-            normalized_lines.append(line)
-        
-        # Join lines back together
-        text = '\n'.join(normalized_lines)
+        # Convert tabs to spaces and collapse runs to a single space
+        text = _SPACE_RUN_RE.sub(' ', text)
         
-        # Collapse excessive newlines (more than 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Strip whitespace around line breaks and collapse blank-line runs
+        # to a paragraph break, in one pass over the whole text
+        if '\n' in text:
+            text = _LINE_BREAK_RE.sub(_collapse_line_break, text)
         
         # Remove leading/trailing whitespace from entire text
         text = text.strip()
@@ -95,10 +130,13 @@ class PDFNormalizer:
         if not text:
             return ""
         
-        # Apply NFC normalization (canonical composition)
-        text = unicodedata.normalize('NFC', text)
+        # ASCII and already-composed text is left as is; both checks are
+        # cheaper than a full normalization pass
+        if text.isascii() or unicodedata.is_normalized('NFC', text):
+            return text
         
-        return text
+        # Apply NFC normalization (canonical composition)
+        return unicodedata.normalize('NFC', text)
     
     def normalize_special_characters(self, text: str) -> str:
         """
@@ -106,6 +144,7 @@ class PDFNormalizer:
         
         - Converts smart quotes to straight quotes
         - Normalizes dashes
+        - Removes invisible characters (zero-width space, BOM, soft hyphen)
         - Preserves bullet points and other symbols
         
         Args:
@@ -117,15 +156,13 @@ class PDFNormalizer:
         if not text:
             return ""
         
-        # Replace smart quotes
-        for smart, straight in self.quote_map.items():
-            text = text.replace(smart, straight)
+        # All mapped characters are non-ASCII
+        if text.isascii():
+            return text
         
-        # Replace dashes
-        for fancy_dash, simple_dash in self.dash_map.items():
-            text = text.replace(fancy_dash, simple_dash)
-        
-        return text
+        # Replace smart quotes and dashes, and drop invisible characters,
+        # in a single pass
+        return text.translate(_SPECIAL_CHAR_TABLE)
     
     def normalize_text(self, text: str) -> str:
         """
@@ -145,9 +182,11 @@ class PDFNormalizer:
         if not text:
             return ""
         
-        # Apply normalizations in order
-        text = self.normalize_unicode(text)
-        text = self.normalize_special_characters(text)
+        # Apply normalizations in order. ASCII text is already NFC and has no
+        # mapped special characters, so only whitespace can change.
+        if not text.isascii():
+            text = self.normalize_unicode(text)
+            text = self.normalize_special_characters(text)
         text = self.normalize_whitespace(text)
         
         return text
@@ -5,10 +5,15 @@ Provides robust text segmentation for downstream AI processing (RAG, summarizati
 Segments text into semantically coherent chunks with configurable size and overlap.
 """
 
+import os
 import time
 import hashlib
 import re
-from typing import List, Optional, Tuple
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
 import spacy
 from spacy.language import Language
 
@@ -20,6 +25,173 @@ from app.schemas.extraction_result import (
 )
 
 
+# Maximum number of segmentation results kept per segmenter instance
+RESULT_CACHE_SIZE = 32
+
+# Texts shorter than this (in characters) are segmented inline by segment_many
+PARALLEL_TEXT_THRESHOLD = 10_000
+
+# Shared default configuration; SegmentationOptions is frozen, so one
+# validated instance can serve every call made without options
+_DEFAULT_OPTIONS = SegmentationOptions()
+
+# Blank-line run separating paragraphs
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+# Texts longer than this (in characters) are split at paragraph breaks into
+# pieces of about this size and streamed through spaCy in batches
+PIPE_PIECE_CHARS = 50_000
+
+# Number of pieces spaCy processes per batch
+PIPE_BATCH_SIZE = 8
+
+# Loaded spaCy pipelines shared by all segmenters, keyed by requested model
+# name and whether the pipeline runs on the GPU
+_NLP_CACHE: dict[tuple[str, bool], Language] = {}
+_NLP_LOCK = threading.Lock()
+
+
+def _get_nlp(model_name: str, use_gpu: bool = False) -> Language:
+    """
+    Get a sentence-segmentation pipeline, loading it once per process.
+    
+    Loading is guarded by a lock so concurrent first calls don't load the
+    same model twice; cache hits don't take the lock.
+    
+    Args:
+        model_name: Name of spaCy model to load
+        use_gpu: Load the model's weights onto the GPU
+        
+    Returns:
+        Loaded spaCy Language model (a blank English pipeline with a
+        rule-based sentencizer if the model isn't installed)
+        
+    Raises:
+        ValueError: If use_gpu is set but no GPU is available
+    """
+    cache_key = (model_name, use_gpu)
+    nlp = _NLP_CACHE.get(cache_key)
+    if nlp is not None:
+        return nlp
+    
+    with _NLP_LOCK:
+        nlp = _NLP_CACHE.get(cache_key)
+        if nlp is not None:
+            return nlp
+        
+        try:
+            # Load model with only sentence segmentation component. GPU
+            # allocation is switched on only while this model loads, so
+            # pipelines loaded later still default to the CPU.
+            if use_gpu:
+                spacy.require_gpu()
+            try:
+                nlp = spacy.load(model_name, disable=["ner", "lemmatizer", "textcat"])
+            finally:
+                if use_gpu:
+                    spacy.require_cpu()
+            
+            # Prefer the statistical sentence recognizer over the much
+            # slower dependency parser when the pipeline ships one
+            if "senter" in nlp.disabled:
+                if "parser" in nlp.pipe_names:
+                    nlp.disable_pipe("parser")
+                nlp.enable_pipe("senter")
+                
+                # Only sentence boundaries are used, so tagging is wasted work
+                for name in ("tagger", "attribute_ruler", "morphologizer"):
+                    if name in nlp.pipe_names:
+                        nlp.disable_pipe(name)
+                
+                # Shared embedding layers can go once nothing enabled listens
+                for name in ("tok2vec", "transformer"):
+                    if name in nlp.pipe_names and not any(
+                        listener in nlp.pipe_names
+                        for listener in getattr(nlp.get_pipe(name), "listening_components", [])
+                    ):
+                        nlp.disable_pipe(name)
+        except OSError:
+            # Fallback to blank model with sentencizer if model not found
+            nlp = spacy.blank("en")
+            nlp.add_pipe("sentencizer")
+        
+        _NLP_CACHE[cache_key] = nlp
+        return nlp
+
+
+def _split_at_paragraphs(text: str, max_chars: int) -> List[str]:
+    """
+    Split text at paragraph breaks into pieces of at most max_chars.
+    
+    Pieces keep their trailing break, so joining them gives back the text
+    unchanged. A single paragraph longer than max_chars stays whole.
+    
+    Args:
+        text: Input text
+        max_chars: Target maximum piece length in characters
+        
+    Returns:
+        List of consecutive pieces of the text
+    """
+    pieces = []
+    start = 0
+    last_break = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(text):
+        # Cut at the previous break once this paragraph would overflow
+        if match.start() - start > max_chars and last_break > start:
+            pieces.append(text[start:last_break])
+            start = last_break
+        last_break = match.end()
+    
+    if len(text) - start > max_chars and last_break > start:
+        pieces.append(text[start:last_break])
+        start = last_break
+    pieces.append(text[start:])
+    return pieces
+
+
+def _cache_key(text: str, options: SegmentationOptions) -> tuple:
+    """
+    Build the result cache key for a text and its options.
+    
+    Keys on a digest so the cache doesn't hold whole documents.
+    
+    Args:
+        text: Input text
+        options: Segmentation configuration
+        
+    Returns:
+        Tuple of (text digest, options)
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return digest, options
+
+
+# Per-process segmenter used by worker processes, so each worker loads its
+# spaCy pipeline once
+_worker_segmenter: Optional["PDFSegmenter"] = None
+
+
+def _segment_text_worker(
+    text: str,
+    options: SegmentationOptions
+) -> SegmentationResult:
+    """
+    Worker entry point: segment one text in a pool process.
+    
+    Args:
+        text: Input text to segment
+        options: Segmentation configuration
+        
+    Returns:
+        SegmentationResult for the text
+    """
+    global _worker_segmenter
+    if _worker_segmenter is None:
+        _worker_segmenter = PDFSegmenter()
+    return _worker_segmenter.segment_text(text, options)
+
+
 class PDFSegmenter:
     """
     PDF text segmentation service for creating AI-ready chunks.
@@ -30,17 +202,36 @@ class PDFSegmenter:
     - Token counting for model constraints
     - Paragraph and section boundary detection
     - Deterministic segmentation behavior
+    
+    Results are cached per digest of the input text and options, so
+    re-segmenting the same text costs a hash and a dictionary lookup.
+    Results are immutable and safe to share between callers, and the cache
+    is guarded by a lock, so one segmenter can serve several threads.
     """
     
-    def __init__(self):
-        """Initialize the PDF segmenter."""
+    def __init__(self, use_gpu: bool = False):
+        """
+        Initialize the PDF segmenter.
+        
+        Args:
+            use_gpu: Run the spaCy pipeline on the GPU (requires a CUDA build
+                of spaCy). Only worthwhile for large, compute-bound models
+                such as transformer pipelines; segment_many workers always
+                use the CPU.
+        """
+        self.use_gpu = use_gpu
         self._nlp: Optional[Language] = None
         self._current_model: str = ""
+        self._result_cache: OrderedDict[tuple, SegmentationResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _load_spacy_model(self, model_name: str) -> Language:
         """
         Load spaCy model with caching.
         
+        Pipelines come from a process-wide cache, so only the first segmenter
+        to use a model pays for loading it.
+        
         Args:
             model_name: Name of spaCy model to load
             
@@ -48,15 +239,8 @@ class PDFSegmenter:
             Loaded spaCy Language model
         """
         if self._nlp is None or self._current_model != model_name:
-            try:
-                # Load model with only sentence segmentation component
-                self._nlp = spacy.load(model_name, disable=["ner", "lemmatizer", "textcat"])
-                self._current_model = model_name
-            except OSError:
-                # Fallback to blank model with sentencizer if model not found
-                self._nlp = spacy.blank("en")
-                self._nlp.add_pipe("sentencizer")
-                self._current_model = "blank_en"
+            self._nlp = _get_nlp(model_name, self.use_gpu)
+            self._current_model = model_name
         
         return self._nlp
     
@@ -73,12 +257,13 @@ class PDFSegmenter:
         Returns:
             Estimated token count
         """
-        if not text or not text.strip():
+        # Strip once; whitespace-only text has no tokens
+        char_count = len(text.strip()) if text else 0
+        if not char_count:
             return 0
         
         # Use character-based estimation: 1 token ≈ 4 characters
         # This is a common approximation for English text
-        char_count = len(text.strip())
         token_estimate = max(1, char_count // 4)
         
         return token_estimate
@@ -94,14 +279,47 @@ class PDFSegmenter:
         Returns:
             List of sentences
         """
+        return [sentence for _, sentence in self._segment_sentence_spans(text, model_name)]
+    
+    def _segment_sentence_spans(self, text: str, model_name: str) -> List[Tuple[int, str]]:
+        """
+        Segment text into sentences using spaCy, keeping their positions.
+        
+        Args:
+            text: Input text
+            model_name: spaCy model to use
+            
+        Returns:
+            List of (start offset in text, stripped sentence) tuples
+        """
         if not text or not text.strip():
             return []
         
         nlp = self._load_spacy_model(model_name)
-        doc = nlp(text)
         
-        sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
-        return sentences
+        # Long texts are streamed through the pipeline in paragraph-aligned
+        # batches rather than parsed as one huge Doc
+        if len(text) > PIPE_PIECE_CHARS:
+            pieces = _split_at_paragraphs(text, PIPE_PIECE_CHARS)
+            docs = nlp.pipe(pieces, batch_size=PIPE_BATCH_SIZE)
+        else:
+            pieces = [text]
+            docs = (nlp(text),)
+        
+        # Share one string object between repeated sentences; a local dict
+        # avoids growing the interpreter-wide intern table
+        unique: dict[str, str] = {}
+        spans = []
+        piece_start = 0
+        for piece, doc in zip(pieces, docs):
+            for sent in doc.sents:
+                raw = sent.text
+                sentence = raw.strip()
+                if sentence:
+                    start = piece_start + sent.start_char + len(raw) - len(raw.lstrip())
+                    spans.append((start, unique.setdefault(sentence, sentence)))
+            piece_start += len(piece)
+        return spans
     
     def _detect_semantic_boundaries(self, text: str, sentences: List[str]) -> List[int]:
         """
@@ -116,11 +334,14 @@ class PDFSegmenter:
         """
         boundaries = []
         
-        # Find paragraph breaks in original text
-        paragraph_break_positions = set()
-        for match in re.finditer(r'\n\s*\n', text):
-            paragraph_break_positions.add(match.start())
-            paragraph_break_positions.add(match.end())
+        # Find paragraph break edges in original text; matches don't overlap,
+        # so the start/end positions come out already sorted
+        paragraph_break_positions = []
+        for match in _PARAGRAPH_BREAK_RE.finditer(text):
+            paragraph_break_positions.extend(match.span())
+        
+        if not paragraph_break_positions:
+            return boundaries
         
         # Check each sentence to see if there's a paragraph break after it
         current_pos = 0
@@ -132,15 +353,60 @@ class PDFSegmenter:
                 
                 # Check if there's a paragraph break after this sentence
                 # Look ahead up to 10 characters for paragraph break
-                for pos in range(sent_end, min(sent_end + 10, len(text))):
-                    if pos in paragraph_break_positions:
-                        boundaries.append(i)
-                        break
+                pos = bisect_left(paragraph_break_positions, sent_end)
+                if (
+                    pos < len(paragraph_break_positions)
+                    and paragraph_break_positions[pos] < min(sent_end + 10, len(text))
+                ):
+                    boundaries.append(i)
                 
                 current_pos = sent_end
         
         return boundaries
     
+    def _compute_overlap(
+        self,
+        prev_chunk: TextSegment,
+        options: SegmentationOptions
+    ) -> Optional[str]:
+        """
+        Compute the overlap text a chunk shares with the chunk before it.
+        
+        Args:
+            prev_chunk: The preceding chunk
+            options: Segmentation configuration
+            
+        Returns:
+            Trailing sentences of prev_chunk within the overlap budget, or None
+        """
+        overlap_size_tokens = int(prev_chunk.token_count * options.overlap_percentage)
+        if overlap_size_tokens <= 0:
+            return None
+        
+        # Take last N sentences from previous chunk, walking back from the
+        # end so only the tail is normalized
+        overlap_sentences = []
+        overlap_tokens = 0
+        
+        for piece in reversed(prev_chunk.text.split(". ")):
+            sent = piece.strip()
+            if not sent:
+                continue
+            if not piece.endswith("."):
+                sent += "."
+            sent_tokens = self._estimate_token_count(sent)
+            if overlap_tokens + sent_tokens <= overlap_size_tokens:
+                overlap_sentences.append(sent)
+                overlap_tokens += sent_tokens
+            else:
+                break
+        
+        if not overlap_sentences:
+            return None
+        
+        overlap_sentences.reverse()
+        return " ".join(overlap_sentences)
+    
     def _create_chunks(
         self,
         sentences: List[str],
@@ -166,11 +432,16 @@ class PDFSegmenter:
         current_chunk_sentences = []
         current_chunk_tokens = 0
         
-        # Detect semantic boundaries (sentence indices where paragraph breaks occur)
-        semantic_boundary_indices = set(self._detect_semantic_boundaries(text, sentences))
+        # Detect semantic boundaries (sentence indices where paragraph breaks occur);
+        # the list is ascending, so range checks can bisect it
+        semantic_boundary_list = self._detect_semantic_boundaries(text, sentences)
+        semantic_boundary_indices = set(semantic_boundary_list)
+        
+        # Estimate every sentence once up front
+        sentence_token_counts = [self._estimate_token_count(sentence) for sentence in sentences]
         
         for i, sentence in enumerate(sentences):
-            sentence_tokens = self._estimate_token_count(sentence)
+            sentence_tokens = sentence_token_counts[i]
             
             # Check if adding this sentence would exceed max chunk size
             would_exceed_max = (current_chunk_tokens + sentence_tokens) > options.max_chunk_size
@@ -201,14 +472,12 @@ class PDFSegmenter:
                 if current_chunk_tokens >= options.min_chunk_size or i == len(sentences) - 1:
                     # For single-chunk documents or last chunk, check if ANY semantic boundaries exist within the chunk
                     if not has_semantic_boundary and options.prefer_semantic_boundaries:
-                        # Count semantic boundaries within this chunk's sentences
+                        # Check for any semantic boundary within this chunk's sentences
                         chunk_start_idx = i - len(current_chunk_sentences) + 1
-                        chunk_end_idx = i
-                        for sent_idx in range(chunk_start_idx, chunk_end_idx + 1):
-                            if sent_idx in semantic_boundary_indices:
-                                has_semantic_boundary = True
-                                semantic_boundaries_used += 1
-                                break  # Only count one boundary per chunk
+                        pos = bisect_left(semantic_boundary_list, chunk_start_idx)
+                        if pos < len(semantic_boundary_list) and semantic_boundary_list[pos] <= i:
+                            has_semantic_boundary = True
+                            semantic_boundaries_used += 1  # Only count one boundary per chunk
                     
                     chunk_text = " ".join(current_chunk_sentences)
                     
@@ -225,27 +494,7 @@ class PDFSegmenter:
                     
                     if chunks:  # Not the first chunk
                         # Calculate overlap from the PREVIOUS chunk's end
-                        prev_chunk = chunks[-1]
-                        overlap_size_tokens = int(prev_chunk.token_count * options.overlap_percentage)
-                        
-                        if overlap_size_tokens > 0:
-                            # Take last N sentences from previous chunk
-                            prev_sentences = prev_chunk.text.split(". ")
-                            prev_sentences = [s.strip() + "." if not s.endswith(".") else s.strip() for s in prev_sentences if s.strip()]
-                            
-                            overlap_sentences = []
-                            overlap_tokens = 0
-                            
-                            for sent in reversed(prev_sentences):
-                                sent_tokens = self._estimate_token_count(sent)
-                                if overlap_tokens + sent_tokens <= overlap_size_tokens:
-                                    overlap_sentences.insert(0, sent)
-                                    overlap_tokens += sent_tokens
-                                else:
-                                    break
-                            
-                            if overlap_sentences:
-                                overlap_with_previous = " ".join(overlap_sentences)
+                        overlap_with_previous = self._compute_overlap(chunks[-1], options)
                     
                     # Generate deterministic segment ID
                     segment_id = self._generate_segment_id(chunk_text, len(chunks))
@@ -266,18 +515,10 @@ class PDFSegmenter:
                     
                     # Update previous chunk's overlap_with_next
                     if len(chunks) > 1 and overlap_with_previous:
-                        # Need to recreate previous segment with overlap_with_next
-                        prev_segment = chunks[-2]
-                        chunks[-2] = TextSegment(
-                            segment_id=prev_segment.segment_id,
-                            text=prev_segment.text,
-                            start_char=prev_segment.start_char,
-                            end_char=prev_segment.end_char,
-                            token_count=prev_segment.token_count,
-                            sentence_count=prev_segment.sentence_count,
-                            has_semantic_boundary=prev_segment.has_semantic_boundary,
-                            overlap_with_previous=prev_segment.overlap_with_previous,
-                            overlap_with_next=overlap_with_previous,
+                        # Copy the (already validated) previous segment with
+                        # overlap_with_next set, skipping re-validation
+                        chunks[-2] = chunks[-2].model_copy(
+                            update={"overlap_with_next": overlap_with_previous}
                         )
                     
                     # Reset for next chunk
@@ -318,13 +559,14 @@ class PDFSegmenter:
         Returns:
             SegmentationResult with segments and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Use default options if not provided
         if options is None:
-            options = SegmentationOptions()
+            options = _DEFAULT_OPTIONS
         
-        # Handle empty text
+        # Handle empty text before any hashing or NLP work; the spaCy
+        # pipeline is only loaded once there is text to split
         if not text or not text.strip():
             metadata = SegmentationMetadata(
                 total_segments=0,
@@ -341,6 +583,13 @@ class PDFSegmenter:
                 source_text_length=0,
             )
         
+        cache_key = _cache_key(text, options)
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached
+        
         # Segment into sentences
         sentences = self._segment_sentences(text, options.sentence_segmentation_model)
         
@@ -361,7 +610,7 @@ class PDFSegmenter:
                 overlap_with_next=None,
             )
             
-            processing_time_ms = (time.time() - start_time) * 1000
+            processing_time_ms = (time.perf_counter() - start_time) * 1000
             
             metadata = SegmentationMetadata(
                 total_segments=1,
@@ -383,7 +632,7 @@ class PDFSegmenter:
         segments, semantic_boundaries_used = self._create_chunks(sentences, text, options)
         
         # Calculate metadata
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
         
         if segments:
             token_counts = [seg.token_count for seg in segments]
@@ -405,8 +654,197 @@ class PDFSegmenter:
             segmentation_time_ms=processing_time_ms,
         )
         
-        return SegmentationResult(
+        result = SegmentationResult(
             segments=segments,
             metadata=metadata,
             source_text_length=len(text),
         )
+        
+        self._store_cached(cache_key, result)
+        return result
+    
+    def _store_cached(self, cache_key: tuple, result: SegmentationResult) -> None:
+        """
+        Cache a result, evicting the least recently used entry if full.
+        
+        Args:
+            cache_key: Key from _cache_key
+            result: Segmentation result
+        """
+        with self._cache_lock:
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def segment_many(
+        self,
+        texts: List[str],
+        options: Optional[SegmentationOptions] = None,
+        max_workers: Optional[int] = None
+    ) -> List[SegmentationResult]:
+        """
+        Segment several independent texts, in parallel when worthwhile.
+        
+        Segmentation is CPU-bound Python, so large texts are spread over
+        worker processes rather than threads. Texts shorter than
+        PARALLEL_TEXT_THRESHOLD characters, cached texts, and batches with
+        a single large text are segmented inline.
+        
+        Args:
+            texts: Input texts to segment
+            options: Optional segmentation configuration
+            max_workers: Maximum worker processes (default: CPU count)
+            
+        Returns:
+            List of SegmentationResult objects in input order
+        """
+        if options is None:
+            options = _DEFAULT_OPTIONS
+        
+        results: List[Optional[SegmentationResult]] = [None] * len(texts)
+        pending: List[int] = []
+        
+        for index, text in enumerate(texts):
+            if len(text) >= PARALLEL_TEXT_THRESHOLD:
+                with self._cache_lock:
+                    cached = self._result_cache.get(_cache_key(text, options))
+                if cached is None:
+                    pending.append(index)
+                    continue
+            results[index] = self.segment_text(text, options)
+        
+        if len(pending) == 1:
+            results[pending[0]] = self.segment_text(texts[pending[0]], options)
+        elif pending:
+            max_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields results in submission order
+                segmented = executor.map(
+                    _segment_text_worker,
+                    [texts[index] for index in pending],
+                    [options] * len(pending),
+                )
+                for index, result in zip(pending, segmented):
+                    results[index] = result
+                    self._store_cached(_cache_key(texts[index], options), result)
+        
+        return results
+    
+    def segment_stream(
+        self,
+        pages: Iterable[str],
+        options: Optional[SegmentationOptions] = None
+    ) -> Iterator[TextSegment]:
+        """
+        Segment a sequence of page texts, yielding chunks as they complete.
+        
+        Pages are treated as one document joined by blank lines (as
+        PDFExtractor joins normalized pages), so chunks may span page
+        breaks and character offsets refer to that joined text. Only
+        the pages since the last completed chunk are held in memory, which
+        keeps peak memory proportional to the chunk size rather than the
+        document. Pass e.g. ``(page.text for page in result.pages)``.
+        
+        Each page is split into sentences together with the sentence it
+        interrupted, so no text is run through spaCy more than once unless
+        a sentence spans pages. A sentence longer than PIPE_PIECE_CHARS is
+        closed at the next page break to keep that rescanning bounded.
+        
+        Args:
+            pages: Iterable of page texts
+            options: Optional segmentation configuration
+            
+        Yields:
+            TextSegment objects in document order
+        """
+        if options is None:
+            options = _DEFAULT_OPTIONS
+        model_name = options.sentence_segmentation_model
+        
+        # Pack chunks once the complete sentences can fill a couple of them
+        flush_tokens = 2 * options.max_chunk_size
+        
+        # Document text from buffer_offset on: the complete sentences not yet
+        # emitted, then the last (possibly unfinished) sentence
+        buffer = ""
+        buffer_offset = 0
+        sentences: List[str] = []
+        sentence_starts: List[int] = []
+        sentence_tokens = 0
+        tail_start = 0
+        tail_sentence: Optional[str] = None
+        
+        emitted = 0
+        last_segment: Optional[TextSegment] = None
+        
+        def rebase(segment: TextSegment, batch_index: int, start_char: int) -> TextSegment:
+            # Place the chunk in the joined document, renumber the ID, and
+            # link the first chunk of a batch to the chunk emitted before it
+            update = {
+                "start_char": start_char,
+                "end_char": start_char + len(segment.text),
+            }
+            # IDs embed the index, so only rehash when the position changed
+            if batch_index != emitted:
+                update["segment_id"] = self._generate_segment_id(segment.text, emitted)
+            if batch_index == 0 and last_segment is not None:
+                update["overlap_with_previous"] = self._compute_overlap(last_segment, options)
+            return segment.model_copy(update=update)
+        
+        for page in pages:
+            if not page:
+                continue
+            buffer = f"{buffer}\n\n{page}" if buffer else page
+            
+            # Re-split only the unfinished sentence plus the new page
+            spans = self._segment_sentence_spans(buffer[tail_start - buffer_offset:], model_name)
+            if not spans:
+                continue
+            if len(buffer) + buffer_offset - tail_start - spans[-1][0] > PIPE_PIECE_CHARS:
+                # Close an overlong sentence here rather than rescan it again
+                complete, tail_sentence = spans, None
+                next_tail_start = buffer_offset + len(buffer)
+            else:
+                complete, tail_sentence = spans[:-1], spans[-1][1]
+                next_tail_start = tail_start + spans[-1][0]
+            for offset, sentence in complete:
+                sentences.append(sentence)
+                sentence_starts.append(tail_start + offset)
+                sentence_tokens += self._estimate_token_count(sentence)
+            tail_start = next_tail_start
+            
+            if sentence_tokens < flush_tokens:
+                continue
+            
+            segments = self._create_chunks(sentences, buffer, options)[0]
+            if len(segments) < 2:
+                continue
+            
+            # Emit all but the last chunk, which may still grow with the
+            # next page; its sentences stay pending
+            first_sentence = 0
+            for index, segment in enumerate(segments[:-1]):
+                last_segment = rebase(segment, index, sentence_starts[first_sentence])
+                first_sentence += segment.sentence_count
+                emitted += 1
+                yield last_segment
+            
+            # Chunks partition the sentences in order, so the held-back chunk
+            # starts at the first sentence not yet emitted
+            del sentences[:first_sentence]
+            del sentence_starts[:first_sentence]
+            sentence_tokens = sum(map(self._estimate_token_count, sentences))
+            buffer = buffer[sentence_starts[0] - buffer_offset:]
+            buffer_offset = sentence_starts[0]
+        
+        # The document ended, so its last sentence is complete
+        if tail_sentence is not None:
+            sentences.append(tail_sentence)
+            sentence_starts.append(tail_start)
+        
+        first_sentence = 0
+        for index, segment in enumerate(self._create_chunks(sentences, buffer, options)[0]):
+            last_segment = rebase(segment, index, sentence_starts[first_sentence])
+            first_sentence += segment.sentence_count
+            emitted += 1
+            yield last_segment
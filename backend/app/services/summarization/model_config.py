@@ -154,6 +154,26 @@ class ModelRegistry:
         # Return a copy to prevent modification of defaults
         return cls._default_configs[model_name].model_copy()
     
+    @classmethod
+    def get_default_config_or_none(cls, model_name: str) -> Optional[ModelConfig]:
+        """Get the default configuration for a model, or None if unregistered.
+        
+        Lookup-style counterpart to get_default_config() for callers that
+        treat a missing model as a normal case rather than an error.
+        
+        Args:
+            model_name: Name of the model
+            
+        Returns:
+            Copy of the default ModelConfig, or None if model is not registered
+        """
+        config = cls._default_configs.get(model_name)
+        if config is None:
+            return None
+        
+        # Return a copy to prevent modification of defaults
+        return config.model_copy()
+    
     @classmethod
     def register_model(cls, model_name: str, config: ModelConfig) -> None:
         """Register a new model with default configuration.
@@ -5,7 +5,8 @@ dynamically based on configuration, enabling easy model swapping without
 code changes.
 """
 
-from typing import Optional, Type, Dict
+import functools
+from typing import Optional, Type, Dict, Tuple
 from app.services.summarization.base_model import BaseSummarizationModel
 from app.services.summarization.model_config import ModelConfig, ModelRegistry
 
@@ -47,6 +48,9 @@ class ModelFactory:
             )
         
         cls._model_registry[model_name] = model_class
+        
+        # Invalidate the memoized model listing
+        cls._available_models.cache_clear()
     
     @classmethod
     def create_model(
@@ -100,6 +104,15 @@ class ModelFactory:
         
         return model_instance
     
+    @classmethod
+    @functools.cache
+    def _available_models(cls) -> Tuple[str, ...]:
+        """Memoized snapshot of registered model names.
+        
+        Invalidated by register_model().
+        """
+        return tuple(cls._model_registry.keys())
+    
     @classmethod
     def list_available_models(cls) -> list[str]:
         """List all models registered with the factory.
@@ -107,7 +120,7 @@ class ModelFactory:
         Returns:
             List of registered model names
         """
-        return list(cls._model_registry.keys())
+        return list(cls._available_models())
     
     @classmethod
     def is_model_available(cls, model_name: str) -> bool:
@@ -8,12 +8,19 @@ The service acts as a facade that delegates to concrete model implementations
 via the ModelFactory, enabling easy model swapping without code changes.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from app.services.summarization.model_factory import ModelFactory
 from app.services.summarization.model_config import ModelConfig, ModelRegistry
 from app.services.summarization.base_model import BaseSummarizationModel
 
 
+# Maximum number of summaries kept per service instance
+SUMMARY_CACHE_SIZE = 64
+
+
 class SummarizationService:
     """Service for generating summaries from text documents.
     
@@ -28,6 +35,11 @@ class SummarizationService:
     - Coherence: Well-structured and readable output
     - Relevance: All content directly related to main topics
     
+    Summaries from deterministic decoding (no sampling) are cached per input
+    text, length limit, model and generation settings, so summarizing the
+    same document again does not rerun the model. Changing the model's
+    config or swapping the model starts from fresh cache keys.
+    
     Usage:
         # Use default model from configuration
         service = SummarizationService()
@@ -80,12 +92,17 @@ class SummarizationService:
             model_name=model_name,
             config=config
         )
+        self._summary_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def summarize(self, text: str, max_length: Optional[int] = None) -> str:
         """Generate a summary of the input text.
         
         This method delegates to the underlying model implementation,
-        ensuring consistent behavior across different model types.
+        ensuring consistent behavior across different model types. Repeated
+        calls with the same text and max_length return the cached summary,
+        as long as the model and its config are unchanged and it doesn't
+        sample its output.
         
         Args:
             text: Source document text to summarize
@@ -98,8 +115,41 @@ class SummarizationService:
             ValueError: If input is invalid (empty, None, etc.)
             RuntimeError: If summarization fails
         """
+        # Invalid input goes straight to the model's validation, and sampled
+        # output differs between calls, so neither is cached
+        config = self.model.config
+        if not isinstance(text, str) or (config is not None and config.do_sample):
+            return self.model.summarize(text, max_length=max_length)
+        
+        # Key on a digest so the cache doesn't hold whole documents, plus a
+        # snapshot of everything that shapes the output
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache_key = (digest, max_length, self._generation_key())
+        with self._cache_lock:
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                self._summary_cache.move_to_end(cache_key)
+                return cached
+        
         # Delegate to model
-        return self.model.summarize(text, max_length=max_length)
+        summary = self.model.summarize(text, max_length=max_length)
+        
+        # Cache the summary, evicting the least recently used entry if full
+        with self._cache_lock:
+            self._summary_cache[cache_key] = summary
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
+    
+    def _generation_key(self) -> tuple:
+        """Build a hashable snapshot of the current model and its settings.
+        
+        Returns:
+            Tuple of (model class, model name, generation config items)
+        """
+        config = self.model.config
+        settings = tuple(config.model_dump().items()) if config is not None else ()
+        return type(self.model), self.model.model_name, settings
     
     def validate_summary(self, source: str, summary: str) -> Dict[str, Any]:
         """Validate a summary against quality criteria.
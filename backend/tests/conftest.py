@@ -30,6 +30,11 @@ Best Practices:
 
 import pytest
 import asyncio
+import gc
+import os
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
@@ -215,7 +220,7 @@ async def sample_summary(db_session: AsyncSession, sample_document, sample_user,
 # Summarization Test Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_documents():
     """Load test documents from fixtures/test_data directory.
     
@@ -249,28 +254,220 @@ def test_documents():
     return documents
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def document_stats(test_documents):
+    """Every test document with its word split precomputed once.
+    
+    Returns:
+        Dictionary mapping document names to namespaces with ``text``,
+        ``words`` and ``word_count``
+    """
+    from types import SimpleNamespace
+    
+    stats = {}
+    for name, text in test_documents.items():
+        words = text.split()
+        stats[name] = SimpleNamespace(text=text, words=words, word_count=len(words))
+    return stats
+
+
+@pytest.fixture(scope="session")
+def standard_document(document_stats):
+    """The standard test document with its word split precomputed.
+    
+    Returns:
+        Namespace with ``text``, ``words`` and ``word_count``
+    """
+    return document_stats["standard"]
+
+
+@pytest.fixture(scope="session")
 def summarization_service():
     """Provide a SummarizationService instance for testing.
     
     This fixture returns the placeholder service that raises NotImplementedError.
     Tests should expect this behavior until actual implementation is added.
+    
+    Session-scoped so the model loads once and the service's summary cache
+    is shared by every test that summarizes the same document.
     """
     from app.services.summarization_service import SummarizationService
     return SummarizationService()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def quality_metrics():
-    """Placeholder fixture for future quality metric calculations.
+    """Placeholder for quality metric calculations; returns None until implemented."""
+    return None
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    """Provide a single PDFExtractor shared across the session.
+    
+    The extractor's only per-document state is its cache of immutable
+    results, so tests reuse one instance instead of constructing (and
+    re-initializing its helpers) each time.
+    """
+    from app.services.pdf_extractor import PDFExtractor
     
-    This will eventually provide functions to calculate:
-    - ROUGE scores
-    - BERTScore
-    - QA-based faithfulness
-    - Coverage metrics
+    return PDFExtractor()
+
+
+@pytest.fixture(scope="session")
+def segmenter():
+    """Provide a single PDFSegmenter shared across the session.
     
-    For now, returns None to indicate metrics are not yet implemented.
+    Like the extractor, it only caches immutable results, and it keeps its
+    spaCy pipeline loaded between tests.
     """
-    return None
+    from app.services.pdf_segmenter import PDFSegmenter
+    
+    return PDFSegmenter()
+
+
+@pytest.fixture(scope="session")
+def gpu_segmenter():
+    """Provide a PDFSegmenter running spaCy on the GPU, or skip without one.
+    
+    CuPy is imported and CUDA queried only when a test first requests this
+    fixture, not while tests are being collected.
+    """
+    try:
+        import cupy
+        has_gpu = cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        has_gpu = False
+    if not has_gpu:
+        pytest.skip("No CUDA device for spaCy")
+    
+    from app.services.pdf_segmenter import PDFSegmenter
+    
+    return PDFSegmenter(use_gpu=True)
+
+
+@pytest.fixture(scope="session")
+def pool():
+    """Provide a thread pool shared by the concurrent pipeline tests.
+    
+    Workers are started once and stay warm across tests instead of each
+    test paying to spin up and tear down its own executor. Threads are
+    named ``pdf_*`` so they are easy to pick out in profiler output.
+    
+    The pool is sized from the CPUs this process may actually run on (which
+    can be fewer than the machine has, e.g. in CI containers), doubled
+    because extraction spends part of its time waiting on file I/O.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS or Windows
+        cpus = os.cpu_count() or 1
+    executor = ThreadPoolExecutor(max_workers=2 * cpus, thread_name_prefix="pdf")
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(scope="session")
+def pdf_bytes_cache():
+    """Contents of every fixture PDF, read from disk once for the session.
+    
+    Keyed by file name; pass the bytes to
+    ``PDFExtractor.extract_text_from_bytes`` to skip per-call file I/O.
+    """
+    fixtures_dir = Path(__file__).parent / "fixtures" / "pdfs"
+    return {path.name: path.read_bytes() for path in fixtures_dir.glob("*.pdf")}
+
+
+@pytest.fixture(scope="session")
+def long_sentences_text():
+    """A 1000-sentence document, built once for the session."""
+    return " ".join([f"This is sentence number {i}." for i in range(1000)])
+
+
+@pytest.fixture(scope="session")
+def long_single_sentence_text():
+    """A single 10,000-word sentence, built once for the session."""
+    return " ".join(["word"] * 10000) + "."
+
+
+@pytest.fixture(scope="session")
+def normalizer():
+    """Provide a single stateless PDFNormalizer shared across the session."""
+    from app.services.pdf_normalizer import PDFNormalizer
+    
+    return PDFNormalizer()
+
 
+@pytest.fixture(scope="session")
+def flan_t5_instance():
+    """Provide a single Flan-T5 model instance shared across the session.
+    
+    Instantiating a model loads its transformer weights, so tests that only
+    read from the model share this instance instead of creating their own.
+    Tests that need different configuration should build a new config via
+    ``model_copy`` rather than mutating this instance.
+    """
+    try:
+        from app.services.summarization.model_factory import ModelFactory
+    except ImportError:
+        pytest.skip("ModelFactory not implemented yet")
+    
+    try:
+        return ModelFactory.create_model("flan-t5-base")
+    except Exception as e:
+        pytest.fail(f"Factory failed to create model: {e}")
+
+
+@pytest.fixture(scope="session")
+def warm_spacy_pipeline():
+    """Load the default spaCy sentence pipeline once before timing tests.
+    
+    Pipelines are cached process-wide, so after this runs, timing
+    comparisons measure segmentation rather than a one-off model load that
+    lands in whichever test happens to run first.
+    """
+    from app.services.pdf_segmenter import PDFSegmenter
+    
+    PDFSegmenter().segment_text("Warm up the pipeline.")
+
+
+# Stack depth recorded per allocation by service_heap_growth; deep enough to
+# reach the service frame beneath spaCy or PyMuPDF internals
+HEAP_TRACEBACK_FRAMES = 25
+
+
+@pytest.fixture
+def service_heap_growth():
+    """Measure Python heap growth attributable to ``app/services``.
+    
+    Starts tracemalloc and snapshots the heap, then yields a callable that
+    returns the net bytes allocated since that snapshot by any call stack
+    passing through a service module. This includes Python objects that
+    spaCy or PyMuPDF create on behalf of the services, but not memory those
+    libraries allocate outside the Python allocator, so tests should keep
+    an RSS bound alongside it.
+    Garbage is collected only right before each snapshot, so tests need
+    not call ``gc.collect()`` themselves.
+    Unlike process RSS, this ignores allocator fragmentation and memory
+    held by other threads.
+    """
+    import app.services
+    
+    services_dir = str(Path(app.services.__file__).parent)
+    
+    def measure() -> int:
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        return sum(
+            stat.size_diff
+            for stat in snapshot.compare_to(baseline, "traceback")
+            if any(frame.filename.startswith(services_dir) for frame in stat.traceback)
+        )
+    
+    gc.collect()
+    tracemalloc.start(HEAP_TRACEBACK_FRAMES)
+    try:
+        baseline = tracemalloc.take_snapshot()
+        yield measure
+    finally:
+        tracemalloc.stop()
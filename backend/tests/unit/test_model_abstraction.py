@@ -15,15 +15,164 @@ Test Categories:
 - TestFactoryPattern: Verify factory pattern implementation
 - TestConfigurationManagement: Verify configuration handling
 - TestComponentDecoupling: Verify decoupling from other system components
+
+These tests never read or write the pytest cache (no --lf/--ff or
+config.cache usage), so quick local runs can skip writing .pytest_cache:
+
+    pytest tests/unit/test_model_abstraction.py -p no:cacheprovider
 """
 
 import pytest
 import ast
+import re
 import importlib
 import inspect
+from abc import ABC
+from functools import lru_cache
 from pathlib import Path
-from typing import Type, List
-from unittest.mock import Mock, patch
+from typing import List
+
+try:
+    from pydantic import ValidationError
+except ImportError:
+    ValidationError = None
+
+
+_SUMMARIZATION_DIR = Path(__file__).resolve().parents[2] / "app" / "services" / "summarization"
+
+# Names summarization modules must not import (PDF processing) or reference
+# anywhere in their source (retrieval components)
+_PDF_FORBIDDEN_IMPORTS = (
+    'pdf_extractor', 'pdf_normalizer', 'pdf_cleaner', 'pdf_segmenter',
+    'PDFExtractor', 'PDFNormalizer', 'PDFCleaner', 'PDFSegmenter'
+)
+_RETRIEVAL_FORBIDDEN_TERMS = ('retrieval', 'search', 'vector_store', 'embedding')
+
+_PDF_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _PDF_FORBIDDEN_IMPORTS)))
+_RETRIEVAL_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _RETRIEVAL_FORBIDDEN_TERMS)))
+
+# Interface every concrete model must provide
+_REQUIRED_METHODS = frozenset({'summarize', 'validate_input', 'get_model_info'})
+_REQUIRED_PROPERTIES = frozenset({'model_name', 'model_version', 'max_input_length'})
+_REQUIRED_INFO_KEYS = frozenset({'model_name', 'model_version', 'max_input_length', 'model_type'})
+
+# Sentinel marking that the ModelFactory import has not been attempted yet
+_UNRESOLVED = object()
+_FACTORY_CLS = _UNRESOLVED
+
+
+def _get_factory():
+    """Return the ModelFactory class, or None if it cannot be imported.
+    
+    The import is attempted only once; both success and failure are
+    remembered so later factory tests don't repeat a failing import.
+    """
+    global _FACTORY_CLS
+    if _FACTORY_CLS is _UNRESOLVED:
+        try:
+            from app.services.summarization.model_factory import ModelFactory
+            _FACTORY_CLS = ModelFactory
+        except ImportError:
+            _FACTORY_CLS = None
+    return _FACTORY_CLS
+
+
+@lru_cache(maxsize=None)
+def _summarization_py_files() -> tuple:
+    """Return all non-package Python files under the summarization directory.
+    
+    The directory listing is computed once and shared by the decoupling tests.
+    """
+    return tuple(
+        py_file for py_file in _SUMMARIZATION_DIR.rglob("*.py")
+        if py_file.name != '__init__.py'
+    )
+
+
+@lru_cache(maxsize=None)
+def _sig_of(fn) -> inspect.Signature:
+    """Return the (cached) signature of ``fn``."""
+    return inspect.signature(fn)
+
+
+@pytest.fixture(scope="session")
+def summarization_py_sources():
+    """Read every summarization source file once per session.
+    
+    Returns:
+        Dict mapping each file path to its source text
+    """
+    return {
+        py_file: py_file.read_text(encoding="utf-8")
+        for py_file in _summarization_py_files()
+    }
+
+
+@pytest.fixture(scope="session")
+def forbidden_import_hits(summarization_py_sources):
+    """Scan every summarization source once for forbidden dependencies.
+    
+    Each file is parsed and scanned a single time; matches are bucketed by
+    category so each decoupling test only has to check its own bucket.
+    
+    Returns:
+        Dict with "pdf" (forbidden imports) and "retrieval" (forbidden
+        references) lists of human-readable violation messages
+    """
+    hits = {"pdf": [], "retrieval": []}
+    
+    for py_file, content in summarization_py_sources.items():
+        for full_import in _collect_imports(ast.parse(content)):
+            if _PDF_FORBIDDEN_RE.search(full_import):
+                hits["pdf"].append(f"{py_file.name} imports {full_import}")
+        
+        if 'embedding' in py_file.name.lower():
+            continue
+        for term in sorted(set(_RETRIEVAL_FORBIDDEN_RE.findall(content.lower()))):
+            hits["retrieval"].append(f"{py_file.name} references '{term}'")
+    
+    return hits
+
+
+# AST fields holding nested statements (or except handlers / match cases,
+# which hold statements in turn)
+_STATEMENT_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+class _ImportCollector(ast.NodeVisitor):
+    """Collect imported names from a module AST.
+    
+    Unlike ``ast.walk``, this only descends into statements that can contain
+    imports, so conditional imports inside functions or classes are still
+    found while expression subtrees are skipped entirely.
+    """
+    
+    def __init__(self):
+        self.imports: List[str] = []
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.extend(alias.name for alias in node.names)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        self.imports.extend(f"{module}.{alias.name}" for alias in node.names)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        # Follow only statement lists (function, class, if/try/with/match
+        # bodies and their handlers); imports never appear in expressions
+        for field in _STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+
+def _collect_imports(tree: ast.AST) -> List[str]:
+    """Return every imported name in ``tree``.
+    
+    Plain imports are reported as ``module``; from-imports as ``module.name``.
+    """
+    collector = _ImportCollector()
+    collector.visit(tree)
+    return collector.imports
 
 
 # ============================================================================
@@ -63,22 +212,11 @@ class TestCouplingDetection:
         ]
         
         # Check all imports
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        assert not any(forbidden in alias.name for forbidden in forbidden_imports), (
-                            f"SummarizationService must not directly import {alias.name}. "
-                            f"Use ModelFactory or dependency injection instead."
-                        )
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for alias in node.names:
-                        full_import = f"{module}.{alias.name}"
-                        assert not any(forbidden in full_import for forbidden in forbidden_imports), (
-                            f"SummarizationService must not directly import {full_import}. "
-                            f"Use ModelFactory or dependency injection instead."
-                        )
+        for full_import in _collect_imports(tree):
+            assert not any(forbidden in full_import for forbidden in forbidden_imports), (
+                f"SummarizationService must not directly import {full_import}. "
+                f"Use ModelFactory or dependency injection instead."
+            )
     
     def test_no_hardcoded_model_names(self):
         """Service must not contain hardcoded model names.
@@ -125,23 +263,22 @@ class TestCouplingDetection:
         try:
             from app.services.summarization.model_factory import ModelFactory
             from app.services.summarization.model_config import ModelConfig
-            
-            # Try to create different models via factory
-            config1 = ModelConfig(model_name="flan-t5-base")
-            model1 = ModelFactory.create_model("flan-t5-base", config1)
-            
-            config2 = ModelConfig(model_name="bart-large-cnn")
-            model2 = ModelFactory.create_model("bart-large-cnn", config2)
-            
-            # Models should be different instances
-            assert model1 is not model2
-            assert type(model1).__name__ != type(model2).__name__
-            
         except ImportError as e:
             pytest.fail(
                 f"ModelFactory or ModelConfig not implemented yet: {e}. "
                 f"This test will pass once the abstraction layer is created."
             )
+        
+        # Try to create different models via factory
+        config1 = ModelConfig(model_name="flan-t5-base")
+        model1 = ModelFactory.create_model("flan-t5-base", config1)
+        
+        config2 = ModelConfig(model_name="bart-large-cnn")
+        model2 = ModelFactory.create_model("bart-large-cnn", config2)
+        
+        # Models should be different instances
+        assert model1 is not model2
+        assert type(model1).__name__ != type(model2).__name__
 
 
 # ============================================================================
@@ -155,6 +292,10 @@ class TestInterfaceCompliance:
     
     These tests ensure that all model implementations follow the same
     contract defined by BaseSummarizationModel.
+    
+    Per-model checks are parametrized so each model is reported (and can
+    fail) independently. They can be spread across workers with
+    ``pytest -n auto`` when pytest-xdist is installed.
     """
     
     def test_base_model_exists(self):
@@ -166,75 +307,63 @@ class TestInterfaceCompliance:
         """
         try:
             from app.services.summarization.base_model import BaseSummarizationModel
-            from abc import ABC
-            
-            # Verify it's an abstract base class
-            assert issubclass(BaseSummarizationModel, ABC), (
-                "BaseSummarizationModel must inherit from ABC"
-            )
-            
-            # Verify it has required abstract methods
-            abstract_methods = [
-                'summarize',
-                'validate_input',
-                'get_model_info'
-            ]
-            
-            for method_name in abstract_methods:
-                assert hasattr(BaseSummarizationModel, method_name), (
-                    f"BaseSummarizationModel must define abstract method '{method_name}'"
-                )
-                
         except ImportError as e:
             pytest.fail(
                 f"BaseSummarizationModel not implemented yet: {e}. "
                 f"Create app/services/summarization/base_model.py"
             )
+        
+        # Verify it's an abstract base class
+        assert issubclass(BaseSummarizationModel, ABC), (
+            "BaseSummarizationModel must inherit from ABC"
+        )
+        
+        # Verify it has required abstract methods
+        for method_name in _REQUIRED_METHODS:
+            assert hasattr(BaseSummarizationModel, method_name), (
+                f"BaseSummarizationModel must define abstract method '{method_name}'"
+            )
     
-    def test_all_models_implement_base_interface(self):
+    @pytest.mark.parametrize("module_path", [
+        'app.services.summarization.models.flan_t5_model',
+        'app.services.summarization.models.bart_model',
+    ])
+    def test_all_models_implement_base_interface(self, module_path):
         """All concrete models must extend BaseSummarizationModel.
         
-        GIVEN: Concrete model implementations
-        WHEN: Checking their inheritance
+        GIVEN: A concrete model implementation module
+        WHEN: Checking its inheritance
         THEN: All must extend BaseSummarizationModel
         """
         try:
             from app.services.summarization.base_model import BaseSummarizationModel
-            
-            # Try to import concrete models
-            model_modules = [
-                'app.services.summarization.models.flan_t5_model',
-                'app.services.summarization.models.bart_model',
-            ]
-            
-            for module_path in model_modules:
-                try:
-                    module = importlib.import_module(module_path)
-                    
-                    # Find model classes in the module
-                    model_classes = [
-                        obj for name, obj in inspect.getmembers(module)
-                        if inspect.isclass(obj) 
-                        and obj.__module__ == module_path
-                        and name.endswith('Model')
-                        and name != 'BaseSummarizationModel'
-                    ]
-                    
-                    assert len(model_classes) > 0, (
-                        f"No model classes found in {module_path}"
-                    )
-                    
-                    for model_class in model_classes:
-                        assert issubclass(model_class, BaseSummarizationModel), (
-                            f"{model_class.__name__} must extend BaseSummarizationModel"
-                        )
-                        
-                except ImportError:
-                    # Model not implemented yet - expected to fail initially
-                    pass
-                    
         except ImportError as e:
             pytest.fail(f"BaseSummarizationModel not found: {e}")
+        
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError:
+            # Model or its dependencies not available yet - expected to fail initially
+            return
+        
+        # Find model classes in the module namespace, so a *Model class that
+        # doesn't extend the base is caught (cheapest predicates first)
+        model_classes = [
+            obj for name, obj in vars(module).items()
+            if name.endswith('Model')
+            and name != 'BaseSummarizationModel'
+            and isinstance(obj, type)
+            and getattr(obj, '__module__', None) == module_path
+        ]
+        
+        assert len(model_classes) > 0, (
+            f"No model classes found in {module_path}"
+        )
+        
+        for model_class in model_classes:
+            assert issubclass(model_class, BaseSummarizationModel), (
+                f"{model_class.__name__} must extend BaseSummarizationModel"
+            )
     
     def test_all_models_have_required_methods(self):
         """All models must implement required methods.
@@ -245,32 +374,27 @@ class TestInterfaceCompliance:
         """
         try:
             from app.services.summarization.base_model import BaseSummarizationModel
-            
-            required_methods = ['summarize', 'validate_input', 'get_model_info']
-            required_properties = ['model_name', 'model_version', 'max_input_length']
-            
-            # Try to import and check FlanT5Model as example
-            try:
-                from app.services.summarization.models.flan_t5_model import FlanT5Model
-                
-                # Check methods
-                for method_name in required_methods:
-                    assert hasattr(FlanT5Model, method_name), (
-                        f"FlanT5Model must implement method '{method_name}'"
-                    )
-                    method = getattr(FlanT5Model, method_name)
-                    assert callable(method), (
-                        f"FlanT5Model.{method_name} must be callable"
-                    )
-                
-                # Check properties (these might be defined in __init__ or as properties)
-                # We'll verify this when we can instantiate the model
-                
-            except ImportError:
-                pytest.skip("FlanT5Model not implemented yet")
-                
         except ImportError as e:
             pytest.fail(f"BaseSummarizationModel not found: {e}")
+        
+        # Try to import and check FlanT5Model as example
+        try:
+            from app.services.summarization.models.flan_t5_model import FlanT5Model
+        except ImportError:
+            pytest.skip("FlanT5Model not implemented yet")
+        
+        # Check methods
+        for method_name in _REQUIRED_METHODS:
+            assert hasattr(FlanT5Model, method_name), (
+                f"FlanT5Model must implement method '{method_name}'"
+            )
+            method = getattr(FlanT5Model, method_name)
+            assert callable(method), (
+                f"FlanT5Model.{method_name} must be callable"
+            )
+        
+        # Check properties (these might be defined in __init__ or as properties)
+        # We'll verify this when we can instantiate the model
     
     def test_model_metadata_consistency(self):
         """All models must provide consistent metadata.
@@ -286,11 +410,9 @@ class TestInterfaceCompliance:
             model = FlanT5Model()
             info = model.get_model_info()
             
-            required_keys = ['model_name', 'model_version', 'max_input_length', 'model_type']
-            
             assert isinstance(info, dict), "get_model_info() must return a dictionary"
             
-            for key in required_keys:
+            for key in _REQUIRED_INFO_KEYS:
                 assert key in info, (
                     f"Model info must contain '{key}' key"
                 )
@@ -321,30 +443,27 @@ class TestFactoryPattern:
         WHEN: Attempting to import ModelFactory
         THEN: Import should succeed
         """
-        try:
-            from app.services.summarization.model_factory import ModelFactory
-            
-            assert ModelFactory is not None
-            
-        except ImportError as e:
+        ModelFactory = _get_factory()
+        if ModelFactory is None:
             pytest.fail(
-                f"ModelFactory not implemented yet: {e}. "
-                f"Create app/services/summarization/model_factory.py"
+                "ModelFactory not implemented yet. "
+                "Create app/services/summarization/model_factory.py"
             )
     
-    def test_factory_creates_correct_model(self):
+    def test_factory_creates_correct_model(self, flan_t5_instance):
         """Factory must instantiate the correct model class.
         
         GIVEN: A model name
         WHEN: Calling ModelFactory.create_model()
         THEN: Correct model instance should be returned
+        
+        The model is created once per session by the ``flan_t5_instance``
+        fixture; this test only reads from it.
         """
         try:
-            from app.services.summarization.model_factory import ModelFactory
             from app.services.summarization.base_model import BaseSummarizationModel
             
-            # Try to create a Flan-T5 model
-            model = ModelFactory.create_model("flan-t5-base")
+            model = flan_t5_instance
             
             assert model is not None, "Factory must return a model instance"
             assert isinstance(model, BaseSummarizationModel), (
@@ -369,14 +488,12 @@ class TestFactoryPattern:
         WHEN: Calling ModelFactory.create_model()
         THEN: Should raise ValueError with clear message
         """
-        try:
-            from app.services.summarization.model_factory import ModelFactory
-            
-            with pytest.raises(ValueError, match="Unknown model|not supported|not found"):
-                ModelFactory.create_model("unknown-model-xyz")
-                
-        except ImportError:
+        ModelFactory = _get_factory()
+        if ModelFactory is None:
             pytest.skip("ModelFactory not implemented yet")
+        
+        with pytest.raises(ValueError, match="Unknown model|not supported|not found"):
+            ModelFactory.create_model("unknown-model-xyz")
     
     def test_factory_respects_configuration(self):
         """Factory must apply configuration to created models.
@@ -385,8 +502,11 @@ class TestFactoryPattern:
         WHEN: Creating a model with custom config
         THEN: Model should use the provided configuration
         """
+        ModelFactory = _get_factory()
+        if ModelFactory is None:
+            pytest.skip("ModelFactory or ModelConfig not implemented yet")
+        
         try:
-            from app.services.summarization.model_factory import ModelFactory
             from app.services.summarization.model_config import ModelConfig
             
             custom_config = ModelConfig(
@@ -417,9 +537,11 @@ class TestFactoryPattern:
         WHEN: Calling list_available_models()
         THEN: Should return list of supported model names
         """
+        ModelFactory = _get_factory()
+        if ModelFactory is None:
+            pytest.skip("ModelFactory not implemented yet")
+        
         try:
-            from app.services.summarization.model_factory import ModelFactory
-            
             available_models = ModelFactory.list_available_models()
             
             assert isinstance(available_models, list), (
@@ -432,8 +554,6 @@ class TestFactoryPattern:
                 "flan-t5-base should be available as default model"
             )
             
-        except ImportError:
-            pytest.skip("ModelFactory not implemented yet")
         except AttributeError:
             pytest.fail("ModelFactory must implement list_available_models() method")
 
@@ -449,6 +569,9 @@ class TestConfigurationManagement:
     
     These tests verify that model configurations are properly validated
     and can be managed consistently.
+    
+    Default config checks are parametrized per model name and can run in
+    parallel with ``pytest -n auto`` when pytest-xdist is installed.
     """
     
     def test_model_config_exists(self):
@@ -460,14 +583,13 @@ class TestConfigurationManagement:
         """
         try:
             from app.services.summarization.model_config import ModelConfig
-            
-            assert ModelConfig is not None
-            
         except ImportError as e:
             pytest.fail(
                 f"ModelConfig not implemented yet: {e}. "
                 f"Create app/services/summarization/model_config.py"
             )
+        
+        assert ModelConfig is not None
     
     def test_config_schema_validation(self):
         """ModelConfig must validate parameters.
@@ -476,61 +598,57 @@ class TestConfigurationManagement:
         WHEN: Creating a ModelConfig instance
         THEN: Should raise validation error
         """
+        if ValidationError is None:
+            pytest.skip("pydantic not installed")
+        
         try:
             from app.services.summarization.model_config import ModelConfig
-            from pydantic import ValidationError
-            
-            # Test invalid max_length (negative)
-            with pytest.raises(ValidationError):
-                ModelConfig(model_name="flan-t5-base", max_length=-100)
-            
-            # Test invalid min_length (greater than max_length)
-            with pytest.raises(ValidationError):
-                ModelConfig(model_name="flan-t5-base", max_length=50, min_length=100)
-            
-            # Test invalid num_beams (negative)
-            with pytest.raises(ValidationError):
-                ModelConfig(model_name="flan-t5-base", num_beams=-1)
-            
-            # Test invalid temperature (out of range)
-            with pytest.raises(ValidationError):
-                ModelConfig(model_name="flan-t5-base", temperature=2.5)
-                
         except ImportError:
             pytest.skip("ModelConfig not implemented yet")
+        
+        # Test invalid max_length (negative)
+        with pytest.raises(ValidationError):
+            ModelConfig(model_name="flan-t5-base", max_length=-100)
+        
+        # Test invalid min_length (greater than max_length)
+        with pytest.raises(ValidationError):
+            ModelConfig(model_name="flan-t5-base", max_length=50, min_length=100)
+        
+        # Test invalid num_beams (negative)
+        with pytest.raises(ValidationError):
+            ModelConfig(model_name="flan-t5-base", num_beams=-1)
+        
+        # Test invalid temperature (out of range)
+        with pytest.raises(ValidationError):
+            ModelConfig(model_name="flan-t5-base", temperature=2.5)
     
-    def test_default_configs_valid(self):
+    @pytest.mark.parametrize("model_name", ["flan-t5-base", "bart-large-cnn"])
+    def test_default_configs_valid(self, model_name):
         """Default configurations for all models must be valid.
         
         GIVEN: The ModelRegistry with default configs
-        WHEN: Retrieving default configurations
-        THEN: All must be valid ModelConfig instances
+        WHEN: Retrieving the default configuration for a known model
+        THEN: It must be a valid ModelConfig instance
         """
         try:
             from app.services.summarization.model_config import ModelRegistry, ModelConfig
             
-            # Get default configs for known models
-            model_names = ["flan-t5-base", "bart-large-cnn"]
+            config = ModelRegistry.get_default_config_or_none(model_name)
+            if config is None:
+                # Model not registered yet - acceptable during development
+                return
             
-            for model_name in model_names:
-                try:
-                    config = ModelRegistry.get_default_config(model_name)
-                    
-                    assert isinstance(config, ModelConfig), (
-                        f"Default config for {model_name} must be ModelConfig instance"
-                    )
-                    assert config.model_name == model_name, (
-                        f"Config model_name mismatch for {model_name}"
-                    )
-                    
-                except KeyError:
-                    # Model not registered yet - acceptable during development
-                    pass
-                    
+            assert isinstance(config, ModelConfig), (
+                f"Default config for {model_name} must be ModelConfig instance"
+            )
+            assert config.model_name == model_name, (
+                f"Config model_name mismatch for {model_name}"
+            )
+                
         except ImportError:
             pytest.skip("ModelRegistry not implemented yet")
         except AttributeError:
-            pytest.fail("ModelRegistry must implement get_default_config() method")
+            pytest.fail("ModelRegistry must implement get_default_config_or_none() method")
     
     def test_config_override_mechanism(self):
         """Configuration must be overridable at runtime.
@@ -541,24 +659,23 @@ class TestConfigurationManagement:
         """
         try:
             from app.services.summarization.model_config import ModelConfig
-            
-            # Create base config
-            base_config = ModelConfig(
-                model_name="flan-t5-base",
-                max_length=150,
-                min_length=30,
-                num_beams=4
-            )
-            
-            # Override specific parameters
-            overridden_config = base_config.model_copy(update={"max_length": 200})
-            
-            assert overridden_config.max_length == 200, "max_length not overridden"
-            assert overridden_config.min_length == 30, "min_length should remain unchanged"
-            assert overridden_config.num_beams == 4, "num_beams should remain unchanged"
-            
         except ImportError:
             pytest.skip("ModelConfig not implemented yet")
+        
+        # Create base config
+        base_config = ModelConfig(
+            model_name="flan-t5-base",
+            max_length=150,
+            min_length=30,
+            num_beams=4
+        )
+        
+        # Override specific parameters
+        overridden_config = base_config.model_copy(update={"max_length": 200})
+        
+        assert overridden_config.max_length == 200, "max_length not overridden"
+        assert overridden_config.min_length == 30, "min_length should remain unchanged"
+        assert overridden_config.num_beams == 4, "num_beams should remain unchanged"
 
 
 # ============================================================================
@@ -574,80 +691,35 @@ class TestComponentDecoupling:
     PDF processing, retrieval, or database components.
     """
     
-    def test_summarization_independent_of_pdf_processing(self):
+    def test_summarization_independent_of_pdf_processing(self, forbidden_import_hits):
         """Summarization must not import PDF processing modules.
         
         GIVEN: All summarization module files
         WHEN: Analyzing their imports
         THEN: None should import PDF processing modules
         """
-        summarization_dir = Path(__file__).parent.parent.parent / "app" / "services" / "summarization"
-        
-        if not summarization_dir.exists():
+        if not _SUMMARIZATION_DIR.exists():
             pytest.skip("Summarization directory not created yet")
         
-        forbidden_imports = [
-            'pdf_extractor', 'pdf_normalizer', 'pdf_cleaner', 'pdf_segmenter',
-            'PDFExtractor', 'PDFNormalizer', 'PDFCleaner', 'PDFSegmenter'
-        ]
-        
-        python_files = list(summarization_dir.rglob("*.py"))
-        
-        for py_file in python_files:
-            if py_file.name == '__init__.py':
-                continue
-                
-            with open(py_file, 'r') as f:
-                content = f.read()
-                tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            assert not any(forbidden in alias.name for forbidden in forbidden_imports), (
-                                f"{py_file.name} must not import {alias.name}. "
-                                f"Summarization must be independent of PDF processing."
-                            )
-                    elif isinstance(node, ast.ImportFrom):
-                        module = node.module or ""
-                        for alias in node.names:
-                            full_import = f"{module}.{alias.name}"
-                            assert not any(forbidden in full_import for forbidden in forbidden_imports), (
-                                f"{py_file.name} must not import {full_import}. "
-                                f"Summarization must be independent of PDF processing."
-                            )
-    
-    def test_summarization_independent_of_retrieval(self):
+        assert not forbidden_import_hits["pdf"], (
+            f"{forbidden_import_hits['pdf']}. "
+            f"Summarization must be independent of PDF processing."
+        )
+    
+    def test_summarization_independent_of_retrieval(self, forbidden_import_hits):
         """Summarization must not import retrieval modules.
         
         GIVEN: All summarization module files
         WHEN: Analyzing their imports
         THEN: None should import retrieval or search modules
         """
-        summarization_dir = Path(__file__).parent.parent.parent / "app" / "services" / "summarization"
-        
-        if not summarization_dir.exists():
+        if not _SUMMARIZATION_DIR.exists():
             pytest.skip("Summarization directory not created yet")
         
-        forbidden_imports = [
-            'retrieval', 'search', 'vector_store', 'embedding'
-        ]
-        
-        python_files = list(summarization_dir.rglob("*.py"))
-        
-        for py_file in python_files:
-            if py_file.name == '__init__.py':
-                continue
-                
-            with open(py_file, 'r') as f:
-                content = f.read()
-            
-            for forbidden in forbidden_imports:
-                assert forbidden not in content.lower() or 'embedding' in py_file.name.lower(), (
-                    f"{py_file.name} should not reference '{forbidden}'. "
-                    f"Summarization must be independent of retrieval."
-                )
+        assert not forbidden_import_hits["retrieval"], (
+            f"{forbidden_import_hits['retrieval']}. "
+            f"Summarization must be independent of retrieval."
+        )
     
     def test_summarization_uses_only_text_input(self):
         """Summarization must only depend on text input, not Document models.
@@ -658,11 +730,10 @@ class TestComponentDecoupling:
         """
         try:
             from app.services.summarization.base_model import BaseSummarizationModel
-            import inspect
             
             # Get the summarize method signature
             summarize_method = getattr(BaseSummarizationModel, 'summarize')
-            sig = inspect.signature(summarize_method)
+            sig = _sig_of(summarize_method)
             
             # Check parameters (excluding self)
             params = [p for name, p in sig.parameters.items() if name != 'self']
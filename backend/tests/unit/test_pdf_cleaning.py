@@ -28,9 +28,8 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pdfs"
 class TestHeaderFooterDetection:
     """Test header and footer detection and removal."""
     
-    def test_detect_consistent_headers_across_pages(self):
+    def test_detect_consistent_headers_across_pages(self, extractor):
         """Headers appearing on all pages should be detected."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -41,9 +40,8 @@ class TestHeaderFooterDetection:
         assert any("CS 101" in header or "Machine Learning" in header 
                   for header in result.cleaning_metadata.headers_removed)
     
-    def test_detect_consistent_footers_across_pages(self):
+    def test_detect_consistent_footers_across_pages(self, extractor):
         """Footers appearing on all pages should be detected."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -54,9 +52,8 @@ class TestHeaderFooterDetection:
         assert any("University" in footer or "Confidential" in footer 
                   for footer in result.cleaning_metadata.footers_removed)
     
-    def test_headers_removed_from_final_text(self):
+    def test_headers_removed_from_final_text(self, extractor):
         """Detected headers should not appear in cleaned text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -65,9 +62,8 @@ class TestHeaderFooterDetection:
         assert "CS 101 - Introduction to Machine Learning" not in result.text
         assert "Fall 2025" not in result.text
     
-    def test_footers_removed_from_final_text(self):
+    def test_footers_removed_from_final_text(self, extractor):
         """Detected footers should not appear in cleaned text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -76,9 +72,8 @@ class TestHeaderFooterDetection:
         assert "© 2025 University of AI" not in result.text
         assert "Do Not Distribute" not in result.text
     
-    def test_ignore_first_page_unique_header(self):
+    def test_ignore_first_page_unique_header(self, extractor):
         """Headers unique to first page (like title) should not be removed."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -99,9 +94,8 @@ class TestHeaderFooterDetection:
 class TestPageNumberRemoval:
     """Test page number detection and removal."""
     
-    def test_remove_simple_page_numbers(self):
+    def test_remove_simple_page_numbers(self, extractor):
         """Simple page numbers like '1', '2', '3' should be removed."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -110,9 +104,8 @@ class TestPageNumberRemoval:
         assert result.cleaning_metadata is not None
         assert len(result.cleaning_metadata.page_numbers_removed) > 0
     
-    def test_remove_page_x_of_y_format(self):
+    def test_remove_page_x_of_y_format(self, extractor):
         """Page numbers in 'Page X of Y' format should be removed."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -122,9 +115,8 @@ class TestPageNumberRemoval:
         page_nums = result.cleaning_metadata.page_numbers_removed
         assert any("of" in str(pn).lower() for pn in page_nums)
     
-    def test_page_numbers_removed_from_text(self):
+    def test_page_numbers_removed_from_text(self, extractor):
         """Detected page numbers should not appear in cleaned text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -134,9 +126,8 @@ class TestPageNumberRemoval:
         assert "Page 2 of 5" not in result.text
         assert "Page 3 of 5" not in result.text
     
-    def test_preserve_numbers_in_content(self):
+    def test_preserve_numbers_in_content(self, extractor):
         """Numbers that are part of content should be preserved."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -159,9 +150,8 @@ class TestPageNumberRemoval:
 class TestRepeatedArtifactRemoval:
     """Test detection and removal of repeated artifacts."""
     
-    def test_detect_watermarks(self):
+    def test_detect_watermarks(self, extractor):
         """Repeated watermarks should be detected and removed."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -171,9 +161,8 @@ class TestRepeatedArtifactRemoval:
         assert len(result.cleaning_metadata.artifacts_removed) > 0
         assert any("DRAFT" in artifact for artifact in result.cleaning_metadata.artifacts_removed)
     
-    def test_watermark_removed_from_text(self):
+    def test_watermark_removed_from_text(self, extractor):
         """Detected watermarks should not appear in cleaned text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -190,9 +179,8 @@ class TestRepeatedArtifactRemoval:
         # This tests the threshold logic
         assert hasattr(cleaner, 'remove_repeated_artifacts')
     
-    def test_preserve_intentional_repetition(self):
+    def test_preserve_intentional_repetition(self, extractor):
         """Intentionally repeated content (like section headers) should be preserved."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -217,9 +205,8 @@ class TestFormattingCleanup:
         assert "Content" in cleaned
         assert "More content" in cleaned
     
-    def test_preserve_bullet_lists(self):
+    def test_preserve_bullet_lists(self, extractor):
         """Bullet points with content should be preserved."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -253,9 +240,8 @@ class TestFormattingCleanup:
 class TestSemanticPreservation:
     """Test that meaningful content is preserved during cleaning."""
     
-    def test_meaningful_content_preserved(self):
+    def test_meaningful_content_preserved(self, extractor):
         """Core lecture content should remain intact."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -267,9 +253,8 @@ class TestSemanticPreservation:
         assert "backpropagation" in result.text.lower()
         assert "gradient descent" in result.text.lower()
     
-    def test_no_false_positives_in_clean_pdf(self):
+    def test_no_false_positives_in_clean_pdf(self, extractor):
         """Clean PDFs should have minimal or no cleaning."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -291,9 +276,8 @@ class TestSemanticPreservation:
         if result1.cleaning_metadata and result2.cleaning_metadata:
             assert result1.cleaning_metadata.total_removals == result2.cleaning_metadata.total_removals
     
-    def test_cleaning_metadata_accurate(self):
+    def test_cleaning_metadata_accurate(self, extractor):
         """Metadata should accurately reflect actual removals."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -312,9 +296,8 @@ class TestSemanticPreservation:
 class TestCleaningOptions:
     """Test configurable cleaning options."""
     
-    def test_disable_header_footer_removal(self):
+    def test_disable_header_footer_removal(self, extractor):
         """Should preserve headers/footers when disabled."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         # Extract with cleaning disabled for headers/footers
@@ -324,9 +307,8 @@ class TestCleaningOptions:
         # Headers/footers should be present
         assert "CS 101" in result.text or "Machine Learning" in result.text
     
-    def test_disable_page_number_removal(self):
+    def test_disable_page_number_removal(self, extractor):
         """Should preserve page numbers when disabled."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         options = CleaningOptions(remove_page_numbers=False)
@@ -335,9 +317,8 @@ class TestCleaningOptions:
         # Page numbers should be present
         assert "Page" in result.text and "of" in result.text
     
-    def test_disable_all_cleaning(self):
+    def test_disable_all_cleaning(self, extractor):
         """Should preserve all noise when all cleaning is disabled."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         options = CleaningOptions(
@@ -355,9 +336,8 @@ class TestCleaningOptions:
 class TestIntegration:
     """Integration tests for end-to-end cleaning pipeline."""
     
-    def test_end_to_end_cleaning_pipeline(self):
+    def test_end_to_end_cleaning_pipeline(self, extractor):
         """Full extraction and cleaning pipeline should work."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -368,9 +348,8 @@ class TestIntegration:
         assert result.cleaning_metadata is not None
         assert result.cleaning_metadata.total_removals > 0
     
-    def test_cleaning_with_multipage_pdf(self):
+    def test_cleaning_with_multipage_pdf(self, extractor):
         """Cleaning should work correctly with multi-page PDFs."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -382,9 +361,8 @@ class TestIntegration:
         # Should detect patterns across all pages
         assert result.cleaning_metadata.total_removals > 0
     
-    def test_cleaning_with_complex_layout(self):
+    def test_cleaning_with_complex_layout(self, extractor):
         """Cleaning should handle complex layouts correctly."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "complex_layout.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -395,9 +373,8 @@ class TestIntegration:
         # Main content should be preserved
         assert "complex layout" in result.text.lower() or "main content" in result.text.lower()
     
-    def test_cleaning_preserves_extraction_metadata(self):
+    def test_cleaning_preserves_extraction_metadata(self, extractor):
         """Cleaning should not interfere with extraction metadata."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
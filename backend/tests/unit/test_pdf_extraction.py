@@ -13,12 +13,12 @@ Test Philosophy:
 
 import pytest
 from pathlib import Path
-from app.services.pdf_extractor import PDFExtractor
 from app.schemas.extraction_result import (
     ExtractionResult,
     ExtractionStatus,
     ExtractionMethod,
 )
+from app.services.pdf_extractor import PDFExtractor
 
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pdfs"
@@ -27,9 +27,8 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pdfs"
 class TestBasicExtraction:
     """Test basic PDF extraction functionality."""
     
-    def test_extract_simple_pdf_returns_text(self):
+    def test_extract_simple_pdf_returns_text(self, extractor):
         """Simple PDF extraction should return non-empty text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -39,9 +38,8 @@ class TestBasicExtraction:
         assert len(result.text) > 0
         assert "Machine Learning" in result.text or "machine learning" in result.text.lower()
     
-    def test_extract_multipage_pdf_preserves_order(self):
+    def test_extract_multipage_pdf_preserves_order(self, extractor):
         """Multi-page PDF should preserve page order."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "multipage.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -55,9 +53,8 @@ class TestBasicExtraction:
             assert page.page_number == i
             assert f"Page {i}" in page.text
     
-    def test_extract_empty_pages_pdf_handles_gracefully(self):
+    def test_extract_empty_pages_pdf_handles_gracefully(self, extractor):
         """PDF with empty pages should be handled gracefully."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "empty_pages.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -70,17 +67,15 @@ class TestBasicExtraction:
         assert "Page 3" in result.text
         assert "Page 5" in result.text
     
-    def test_extract_nonexistent_file_raises_error(self):
+    def test_extract_nonexistent_file_raises_error(self, extractor):
         """Attempting to extract non-existent file should raise FileNotFoundError."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "nonexistent.pdf"
         
         with pytest.raises(FileNotFoundError):
             extractor.extract_text(pdf_path)
     
-    def test_extract_returns_extraction_metadata(self):
+    def test_extract_returns_extraction_metadata(self, extractor):
         """Extraction should return comprehensive metadata."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -96,9 +91,8 @@ class TestBasicExtraction:
 class TestReadingOrderPreservation:
     """Test reading order preservation for complex layouts."""
     
-    def test_multi_column_layout_preserves_reading_order(self):
+    def test_multi_column_layout_preserves_reading_order(self, extractor):
         """Two-column layout should maintain correct reading order."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "multi_column.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -115,9 +109,8 @@ class TestReadingOrderPreservation:
         assert abstract_pos < intro_pos < method_pos, \
             "Reading order not preserved in multi-column layout"
     
-    def test_complex_layout_maintains_logical_flow(self):
+    def test_complex_layout_maintains_logical_flow(self, extractor):
         """Complex layout with sidebars should maintain logical flow."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "complex_layout.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -134,9 +127,8 @@ class TestReadingOrderPreservation:
         assert main_content_pos != -1 or sidebar_pos != -1, \
             "Failed to extract content from complex layout"
     
-    def test_text_blocks_sorted_top_to_bottom(self):
+    def test_text_blocks_sorted_top_to_bottom(self, extractor):
         """Text blocks should be sorted from top to bottom of page."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -155,9 +147,8 @@ class TestReadingOrderPreservation:
 class TestWhitespaceNormalization:
     """Test whitespace normalization logic."""
     
-    def test_excessive_spaces_normalized_to_single_space(self):
+    def test_excessive_spaces_normalized_to_single_space(self, extractor):
         """Multiple consecutive spaces should be normalized to single space."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "excessive_whitespace.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -166,9 +157,8 @@ class TestWhitespaceNormalization:
         assert "  " not in result.text, \
             "Multiple consecutive spaces not normalized"
     
-    def test_paragraph_breaks_preserved(self):
+    def test_paragraph_breaks_preserved(self, extractor):
         """Paragraph breaks (double newlines) should be preserved."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -177,9 +167,8 @@ class TestWhitespaceNormalization:
         assert "\n\n" in result.text or "\n" in result.text, \
             "Paragraph structure not preserved"
     
-    def test_leading_trailing_whitespace_removed(self):
+    def test_leading_trailing_whitespace_removed(self, extractor):
         """Leading and trailing whitespace should be removed from text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "excessive_whitespace.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -194,9 +183,8 @@ class TestWhitespaceNormalization:
                 assert line == line.rstrip(), \
                     f"Line has trailing whitespace: '{line}'"
     
-    def test_tabs_converted_to_spaces(self):
+    def test_tabs_converted_to_spaces(self, extractor):
         """Tab characters should be converted to spaces."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "excessive_whitespace.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -205,9 +193,8 @@ class TestWhitespaceNormalization:
         assert "\t" not in result.text, \
             "Tab characters not converted to spaces"
     
-    def test_multiple_newlines_collapsed_appropriately(self):
+    def test_multiple_newlines_collapsed_appropriately(self, extractor):
         """Excessive newlines should be collapsed while preserving paragraphs."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "excessive_whitespace.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -220,9 +207,8 @@ class TestWhitespaceNormalization:
 class TestEncodingHandling:
     """Test encoding and special character handling."""
     
-    def test_utf8_text_extracted_correctly(self):
+    def test_utf8_text_extracted_correctly(self, extractor):
         """UTF-8 encoded text should be extracted correctly."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "encoding_issues.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -230,9 +216,8 @@ class TestEncodingHandling:
         assert result.status in [ExtractionStatus.SUCCESS, ExtractionStatus.PARTIAL]
         assert len(result.text) > 0
     
-    def test_special_characters_preserved(self):
+    def test_special_characters_preserved(self, extractor):
         """Special characters and unicode should be preserved."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "encoding_issues.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -246,9 +231,8 @@ class TestEncodingHandling:
         assert has_special_chars or has_math_symbols, \
             "Special characters not preserved during extraction"
     
-    def test_smart_quotes_handled(self):
+    def test_smart_quotes_handled(self, extractor):
         """Smart quotes should be handled appropriately."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "encoding_issues.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -257,9 +241,8 @@ class TestEncodingHandling:
         assert '"' in result.text or '"' in result.text or '"' in result.text, \
             "Quotes not handled correctly"
     
-    def test_unicode_normalization_applied(self):
+    def test_unicode_normalization_applied(self, extractor):
         """Unicode normalization should be applied consistently."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "encoding_issues.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -274,9 +257,8 @@ class TestEncodingHandling:
 class TestMixedContent:
     """Test extraction from PDFs with mixed content (text, tables, images)."""
     
-    def test_mixed_content_pdf_extracts_text(self):
+    def test_mixed_content_pdf_extracts_text(self, extractor):
         """PDF with tables and mixed content should extract text."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "mixed_content.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -284,9 +266,8 @@ class TestMixedContent:
         assert result.status in [ExtractionStatus.SUCCESS, ExtractionStatus.PARTIAL]
         assert "Quarterly Report" in result.text or "quarterly report" in result.text.lower()
     
-    def test_table_content_extracted(self):
+    def test_table_content_extracted(self, extractor):
         """Table content should be extracted."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "mixed_content.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -300,9 +281,8 @@ class TestMixedContent:
 class TestErrorHandling:
     """Test error handling and edge cases."""
     
-    def test_extraction_result_includes_page_results(self):
+    def test_extraction_result_includes_page_results(self, extractor):
         """Extraction result should include per-page results."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "multipage.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -311,34 +291,29 @@ class TestErrorHandling:
         assert all(hasattr(page, 'text') for page in result.pages)
         assert all(hasattr(page, 'page_number') for page in result.pages)
     
-    def test_extraction_metadata_includes_timing(self):
+    def test_extraction_metadata_includes_timing(self, extractor):
         """Extraction metadata should include processing time."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
         
         assert result.metadata.processing_time_ms >= 0
     
-    def test_extraction_tracks_success_rate(self):
+    def test_extraction_tracks_success_rate(self, extractor):
         """Extraction result should track success rate."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
         
         assert 0 <= result.success_rate <= 100
     
-    def test_invalid_pdf_path_type_raises_error(self):
+    def test_invalid_pdf_path_type_raises_error(self, extractor):
         """Invalid path type should raise TypeError."""
-        extractor = PDFExtractor()
-        
         with pytest.raises(TypeError):
             extractor.extract_text(123)  # Invalid type
     
-    def test_extraction_result_is_immutable(self):
+    def test_extraction_result_is_immutable(self, extractor):
         """Extraction result should be immutable (frozen)."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -351,9 +326,8 @@ class TestErrorHandling:
 class TestWordAndCharacterCounts:
     """Test accurate word and character counting."""
     
-    def test_char_count_accurate(self):
+    def test_char_count_accurate(self, extractor):
         """Character count should be accurate."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -361,9 +335,8 @@ class TestWordAndCharacterCounts:
         # Verify character count matches actual text length
         assert result.total_char_count == len(result.text)
     
-    def test_word_count_reasonable(self):
+    def test_word_count_reasonable(self, extractor):
         """Word count should be reasonable."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -374,15 +347,83 @@ class TestWordAndCharacterCounts:
         # Rough validation: word count should be less than char count
         assert result.total_word_count < result.total_char_count
     
-    def test_per_page_counts_sum_to_total(self):
+    def test_per_page_counts_sum_to_total(self, extractor):
         """Per-page counts should sum to total counts."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "multipage.pdf"
         
         result = extractor.extract_text(pdf_path)
         
         total_chars = sum(page.char_count for page in result.pages)
         total_words = sum(page.word_count for page in result.pages)
+        total_blocks = sum(len(page.text_blocks) for page in result.pages)
         
         assert total_chars == result.total_char_count
         assert total_words == result.total_word_count
+        assert total_blocks == result.total_text_blocks
+
+
+class TestResultCaching:
+    """Test reuse of extraction results."""
+    
+    def test_copied_pdf_reuses_cached_result(self, tmp_path):
+        """A byte-identical copy at a new path should hit the content cache."""
+        extractor = PDFExtractor()
+        pdf_path = FIXTURES_DIR / "clean_simple.pdf"
+        copy_path = tmp_path / "uploaded_copy.pdf"
+        copy_path.write_bytes(pdf_path.read_bytes())
+        
+        result = extractor.extract_text(pdf_path)
+        copy_result = extractor.extract_text(copy_path)
+        
+        assert copy_result is result
+        
+        # Different cleaning settings must not share the cached result
+        raw_result = extractor.extract_text(copy_path, apply_cleaning=False)
+        assert raw_result is not result
+    
+    def test_extract_text_many_preserves_order_and_caches(self):
+        """Batch extraction should return results in input order and cache them."""
+        extractor = PDFExtractor()
+        pdf_paths = [
+            FIXTURES_DIR / "multipage.pdf",
+            FIXTURES_DIR / "clean_simple.pdf",
+        ]
+        
+        results = extractor.extract_text_many(pdf_paths, max_workers=2)
+        
+        assert [result.status for result in results] == [ExtractionStatus.SUCCESS] * 2
+        assert results[0].metadata.total_pages == 5
+        
+        # Results from worker processes should populate this extractor's cache
+        for pdf_path, result in zip(pdf_paths, results):
+            assert extractor.extract_text(pdf_path) is result
+    
+    def test_extract_text_many_extracts_duplicates_once(self, tmp_path):
+        """Repeated paths and identical copies in a batch should share one result."""
+        extractor = PDFExtractor()
+        pdf_path = FIXTURES_DIR / "clean_simple.pdf"
+        copy_path = tmp_path / "copy.pdf"
+        copy_path.write_bytes(pdf_path.read_bytes())
+        
+        results = extractor.extract_text_many([pdf_path, copy_path, pdf_path])
+        
+        assert results[0] is results[1] is results[2]
+    
+    def test_extract_text_from_bytes_matches_file(self):
+        """In-memory extraction should match and share results with file extraction."""
+        extractor = PDFExtractor()
+        pdf_path = FIXTURES_DIR / "clean_simple.pdf"
+        data = pdf_path.read_bytes()
+        
+        bytes_result = PDFExtractor().extract_text_from_bytes(data)
+        file_result = extractor.extract_text(pdf_path)
+        
+        assert bytes_result.status == ExtractionStatus.SUCCESS
+        assert bytes_result.text == file_result.text
+        assert bytes_result.metadata.file_size_bytes == len(data)
+        
+        # Bytes of an already extracted file come from the content cache
+        assert extractor.extract_text_from_bytes(data) is file_result
+        
+        with pytest.raises(TypeError):
+            extractor.extract_text_from_bytes(str(pdf_path))
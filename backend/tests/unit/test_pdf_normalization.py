@@ -6,45 +6,36 @@ unicode, and special characters. Tests are IMMUTABLE.
 """
 
 import pytest
-from app.services.pdf_normalizer import PDFNormalizer
 
 
 class TestWhitespaceNormalization:
     """Test whitespace normalization functions."""
     
-    def test_multiple_spaces_collapsed(self):
+    def test_multiple_spaces_collapsed(self, normalizer):
         """Multiple consecutive spaces should collapse to single space."""
-        normalizer = PDFNormalizer()
-        
         text = "This  has   multiple    spaces"
         result = normalizer.normalize_whitespace(text)
         
         assert result == "This has multiple spaces"
         assert "  " not in result
     
-    def test_tabs_converted_to_spaces(self):
+    def test_tabs_converted_to_spaces(self, normalizer):
         """Tabs should be converted to single spaces."""
-        normalizer = PDFNormalizer()
-        
         text = "Tab\tseparated\ttext"
         result = normalizer.normalize_whitespace(text)
         
         assert "\t" not in result
         assert "Tab separated text" == result
     
-    def test_multiple_newlines_preserved_for_paragraphs(self):
+    def test_multiple_newlines_preserved_for_paragraphs(self, normalizer):
         """Double newlines (paragraph breaks) should be preserved."""
-        normalizer = PDFNormalizer()
-        
         text = "Paragraph one.\n\nParagraph two."
         result = normalizer.normalize_whitespace(text)
         
         assert "\n\n" in result
     
-    def test_excessive_newlines_collapsed(self):
+    def test_excessive_newlines_collapsed(self, normalizer):
         """More than 2 consecutive newlines should be collapsed."""
-        normalizer = PDFNormalizer()
-        
         text = "Line one.\n\n\n\n\nLine two."
         result = normalizer.normalize_whitespace(text)
         
@@ -52,19 +43,15 @@ class TestWhitespaceNormalization:
         # Should have at most double newlines
         assert result.count('\n') <= 2
     
-    def test_leading_trailing_whitespace_removed(self):
+    def test_leading_trailing_whitespace_removed(self, normalizer):
         """Leading and trailing whitespace should be removed."""
-        normalizer = PDFNormalizer()
-        
         text = "   Text with spaces   "
         result = normalizer.normalize_whitespace(text)
         
         assert result == "Text with spaces"
     
-    def test_carriage_returns_normalized(self):
+    def test_carriage_returns_normalized(self, normalizer):
         """Carriage returns should be normalized to newlines."""
-        normalizer = PDFNormalizer()
-        
         text = "Line one\r\nLine two\rLine three"
         result = normalizer.normalize_whitespace(text)
         
@@ -75,10 +62,8 @@ class TestWhitespaceNormalization:
 class TestUnicodeNormalization:
     """Test unicode normalization."""
     
-    def test_nfc_normalization_applied(self):
+    def test_nfc_normalization_applied(self, normalizer):
         """Unicode should be normalized to NFC form."""
-        normalizer = PDFNormalizer()
-        
         # Combining characters: e + combining acute accent
         text = "cafe\u0301"  # café with combining accent
         result = normalizer.normalize_unicode(text)
@@ -86,10 +71,8 @@ class TestUnicodeNormalization:
         # Should be normalized to precomposed form
         assert result == "café"
     
-    def test_combining_characters_normalized(self):
+    def test_combining_characters_normalized(self, normalizer):
         """Combining characters should be normalized."""
-        normalizer = PDFNormalizer()
-        
         # Multiple combining characters
         text = "a\u0300\u0301"  # a with grave and acute accents
         result = normalizer.normalize_unicode(text)
@@ -97,10 +80,8 @@ class TestUnicodeNormalization:
         # Should be normalized (exact result depends on NFC rules)
         assert len(result) <= len(text)
     
-    def test_ligatures_handled(self):
+    def test_ligatures_handled(self, normalizer):
         """Ligatures should be handled appropriately."""
-        normalizer = PDFNormalizer()
-        
         # Common ligatures
         text = "ﬁ ﬂ ﬀ ﬃ ﬄ"  # fi, fl, ff, ffi, ffl ligatures
         result = normalizer.normalize_unicode(text)
@@ -112,30 +93,24 @@ class TestUnicodeNormalization:
 class TestSpecialCharacterHandling:
     """Test special character normalization."""
     
-    def test_smart_quotes_normalized(self):
+    def test_smart_quotes_normalized(self, normalizer):
         """Smart quotes should be normalized to straight quotes."""
-        normalizer = PDFNormalizer()
-        
         text = "\u201csmart quotes\u201d and \u2018apostrophes\u2019"
         result = normalizer.normalize_special_characters(text)
         
         # Should convert to straight quotes
         assert '"smart quotes" and \'apostrophes\'' == result
     
-    def test_em_dashes_preserved(self):
+    def test_em_dashes_preserved(self, normalizer):
         """Em dashes should be preserved or normalized consistently."""
-        normalizer = PDFNormalizer()
-        
         text = "Text — with em dash"
         result = normalizer.normalize_special_characters(text)
         
         # Should contain either em dash or normalized equivalent
         assert "—" in result or " - " in result or "--" in result
     
-    def test_bullet_points_preserved(self):
+    def test_bullet_points_preserved(self, normalizer):
         """Bullet points should be preserved."""
-        normalizer = PDFNormalizer()
-        
         text = "• Item one\n• Item two"
         result = normalizer.normalize_special_characters(text)
         
@@ -146,10 +121,8 @@ class TestSpecialCharacterHandling:
 class TestFullNormalization:
     """Test complete normalization pipeline."""
     
-    def test_normalize_text_applies_all_transformations(self):
+    def test_normalize_text_applies_all_transformations(self, normalizer):
         """Full normalization should apply all transformations."""
-        normalizer = PDFNormalizer()
-        
         text = "  Text  with\t\tmultiple   issues\n\n\n\nand  problems  "
         result = normalizer.normalize_text(text)
         
@@ -159,27 +132,21 @@ class TestFullNormalization:
         assert "\n\n\n" not in result
         assert result == result.strip()
     
-    def test_empty_string_returns_empty(self):
+    def test_empty_string_returns_empty(self, normalizer):
         """Empty string should return empty string."""
-        normalizer = PDFNormalizer()
-        
         result = normalizer.normalize_text("")
         
         assert result == ""
     
-    def test_whitespace_only_returns_empty(self):
+    def test_whitespace_only_returns_empty(self, normalizer):
         """Whitespace-only string should return empty string."""
-        normalizer = PDFNormalizer()
-        
         text = "   \t\n\n   "
         result = normalizer.normalize_text(text)
         
         assert result == ""
     
-    def test_normalization_is_idempotent(self):
+    def test_normalization_is_idempotent(self, normalizer):
         """Normalizing already normalized text should not change it."""
-        normalizer = PDFNormalizer()
-        
         text = "This is already normalized text."
         result1 = normalizer.normalize_text(text)
         result2 = normalizer.normalize_text(result1)
@@ -190,10 +157,8 @@ class TestFullNormalization:
 class TestParagraphDetection:
     """Test paragraph structure detection and preservation."""
     
-    def test_paragraph_breaks_detected(self):
+    def test_paragraph_breaks_detected(self, normalizer):
         """Paragraph breaks should be detected from spacing."""
-        normalizer = PDFNormalizer()
-        
         text = "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
         result = normalizer.normalize_text(text)
         
@@ -201,10 +166,8 @@ class TestParagraphDetection:
         paragraphs = result.split("\n\n")
         assert len(paragraphs) == 3
     
-    def test_single_line_breaks_within_paragraphs_handled(self):
+    def test_single_line_breaks_within_paragraphs_handled(self, normalizer):
         """Single line breaks within paragraphs should be handled."""
-        normalizer = PDFNormalizer()
-        
         # PDF might break lines mid-sentence
         text = "This is a sentence that\nspans multiple lines\nin the PDF."
         result = normalizer.normalize_text(text)
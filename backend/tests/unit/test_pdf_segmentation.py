@@ -14,7 +14,6 @@ Test Philosophy:
 import pytest
 from pathlib import Path
 from app.services.pdf_segmenter import PDFSegmenter
-from app.services.pdf_extractor import PDFExtractor
 from app.schemas.extraction_result import (
     SegmentationOptions,
     SegmentationMetadata,
@@ -82,6 +81,23 @@ class TestSentenceSegmentation:
         
         # Should create at least 1 segment
         assert result.metadata.total_segments >= 1
+    
+    def test_long_text_streamed_in_pieces_keeps_every_sentence(self):
+        """Text long enough to be split for spaCy should lose no sentences."""
+        from app.services.pdf_segmenter import PIPE_PIECE_CHARS
+        
+        segmenter = PDFSegmenter()
+        
+        text = "\n\n".join(f"Paragraph {i} has one sentence." for i in range(2000))
+        assert len(text) > PIPE_PIECE_CHARS
+        
+        options = SegmentationOptions(overlap_percentage=0.0)
+        result = segmenter.segment_text(text, options)
+        
+        # Should detect every sentence exactly once, in order
+        assert result.metadata.total_sentences == 2000
+        reconstructed = " ".join(seg.text for seg in result.segments)
+        assert reconstructed.split() == text.split()
 
 
 class TestSemanticChunking:
@@ -510,9 +526,8 @@ class TestDeterministicBehavior:
 class TestIntegration:
     """End-to-end pipeline tests."""
     
-    def test_integration_with_pdf_extraction(self):
+    def test_integration_with_pdf_extraction(self, extractor):
         """Segmentation should work with extracted PDF text."""
-        extractor = PDFExtractor()
         segmenter = PDFSegmenter()
         
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
@@ -527,9 +542,8 @@ class TestIntegration:
         assert segmentation_result.metadata.total_segments > 0
         assert len(segmentation_result.segments) > 0
     
-    def test_integration_with_multipage_pdf(self):
+    def test_integration_with_multipage_pdf(self, extractor):
         """Segmentation should handle multi-page PDFs."""
-        extractor = PDFExtractor()
         segmenter = PDFSegmenter()
         
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
@@ -543,9 +557,8 @@ class TestIntegration:
         # Should create multiple segments for multi-page document
         assert segmentation_result.metadata.total_segments > 1
     
-    def test_full_pipeline_extract_clean_segment(self):
+    def test_full_pipeline_extract_clean_segment(self, extractor):
         """Full pipeline: extract → clean → segment should work."""
-        extractor = PDFExtractor()
         segmenter = PDFSegmenter()
         
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
@@ -570,9 +583,8 @@ class TestIntegration:
             assert segment.token_count > 0
             assert segment.end_char > segment.start_char
     
-    def test_segmentation_preserves_content(self):
+    def test_segmentation_preserves_content(self, extractor):
         """Segmentation should preserve all content from source."""
-        extractor = PDFExtractor()
         segmenter = PDFSegmenter()
         
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
@@ -589,3 +601,70 @@ class TestIntegration:
         
         # Should match original (allowing for whitespace normalization)
         assert reconstructed.strip() == original_text.strip()
+
+
+class TestStreamingSegmentation:
+    """Test page-by-page streaming segmentation."""
+    
+    def test_single_page_matches_segment_text(self):
+        """A short single page should stream the same segments as segment_text."""
+        segmenter = PDFSegmenter()
+        
+        text = " ".join([f"This is sentence {i}." for i in range(50)])
+        
+        streamed = list(segmenter.segment_stream([text]))
+        result = segmenter.segment_text(text)
+        
+        assert streamed == result.segments
+    
+    def test_multipage_stream_covers_document_in_order(self):
+        """Streamed segments should cover every page in document order."""
+        segmenter = PDFSegmenter()
+        
+        pages = [
+            " ".join([f"Page {page} sentence {i}." for i in range(120)])
+            for page in range(5)
+        ]
+        options = SegmentationOptions(chunk_size_tokens=100, max_chunk_size=200, overlap_percentage=0.0)
+        
+        segments = list(segmenter.segment_stream(iter(pages), options))
+        document = "\n\n".join(pages)
+        
+        # Should emit multiple chunks with unique IDs and increasing offsets
+        assert len(segments) > 5
+        assert len({seg.segment_id for seg in segments}) == len(segments)
+        starts = [seg.start_char for seg in segments]
+        assert starts == sorted(starts)
+        
+        # Every chunk should start where its text appears in the joined document
+        for segment in segments:
+            first_sentence = segment.text.split(". ")[0]
+            assert document[segment.start_char:].startswith(first_sentence)
+        
+        # No content lost or duplicated without overlap
+        reconstructed = " ".join(seg.text for seg in segments)
+        assert reconstructed.split() == document.split()
+
+
+class TestBatchSegmentation:
+    """Test segmenting several documents at once."""
+    
+    def test_segment_many_matches_individual_results(self):
+        """Batch results should match per-text segmentation, in input order."""
+        segmenter = PDFSegmenter()
+        
+        texts = [
+            "First short document. It has two sentences.",
+            " ".join([f"Long document A sentence {i}." for i in range(600)]),
+            "",
+            " ".join([f"Long document B sentence {i}." for i in range(600)]),
+        ]
+        
+        results = segmenter.segment_many(texts, max_workers=2)
+        
+        assert len(results) == len(texts)
+        for text, result in zip(texts, results):
+            expected = PDFSegmenter().segment_text(text)
+            assert result.source_text_length == len(text)
+            assert [seg.text for seg in result.segments] == [seg.text for seg in expected.segments]
+            assert [seg.segment_id for seg in result.segments] == [seg.segment_id for seg in expected.segments]
@@ -25,14 +25,17 @@ from app.schemas.extraction_result import SegmentationOptions
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pdfs"
 
-# Mark all tests in this module as performance tests
-pytestmark = [pytest.mark.performance]
+# Mark all tests in this module as performance tests, timed against a
+# loaded spaCy pipeline
+pytestmark = [pytest.mark.performance, pytest.mark.usefixtures("warm_spacy_pipeline")]
+
+# Handle on the test process, created once and reused by every measurement
+_PROCESS = psutil.Process(os.getpid())
 
 
 def get_memory_usage_mb():
     """Get current process memory usage in MB."""
-    process = psutil.Process(os.getpid())
-    return process.memory_info().rss / 1024 / 1024
+    return _PROCESS.memory_info().rss / 1024 / 1024
 
 
 class TestExtractionPerformance:
@@ -78,14 +81,14 @@ class TestExtractionPerformance:
         medium_pdf = FIXTURES_DIR / "pdf_with_noise.pdf"  # 5 pages
         
         # Time small PDF
-        start = time.time()
+        start = time.perf_counter()
         result_small = extractor.extract_text(small_pdf)
-        time_small = time.time() - start
+        time_small = time.perf_counter() - start
         
         # Time medium PDF
-        start = time.time()
+        start = time.perf_counter()
         result_medium = extractor.extract_text(medium_pdf)
-        time_medium = time.time() - start
+        time_medium = time.perf_counter() - start
         
         # Calculate time per page
         time_per_page_small = time_small / result_small.metadata.total_pages
@@ -151,24 +154,26 @@ class TestMemoryUsage:
         assert result.status.value == "success"
         assert mem_used < 100, f"Used {mem_used:.1f}MB, expected <100MB"
     
-    def test_memory_cleanup_after_processing(self):
+    def test_memory_cleanup_after_processing(self, service_heap_growth):
         """Memory should be released after processing."""
-        gc.collect()
         mem_baseline = get_memory_usage_mb()
         
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
-        # Process multiple times
+        # Process multiple times, with a fresh extractor each time so every
+        # run extracts instead of returning the cached result
         for _ in range(5):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text(pdf_path)
             assert result.status.value == "success"
         
-        # Force garbage collection
-        gc.collect()
+        heap_growth = service_heap_growth() / 1024 / 1024
         mem_after = get_memory_usage_mb()
         
-        # Memory should not grow significantly (allow 20MB growth for caches)
+        # Python heap allocated through the services should be released
+        assert heap_growth < 10, f"Service heap grew by {heap_growth:.1f}MB after 5 extractions, expected <10MB"
+        
+        # Memory should not grow significantly (allow 20MB growth for caches);
+        # RSS also covers PyMuPDF's native allocations
         mem_growth = mem_after - mem_baseline
         assert mem_growth < 20, f"Memory grew by {mem_growth:.1f}MB after 5 extractions, expected <20MB"
     
@@ -177,12 +182,12 @@ class TestMemoryUsage:
         gc.collect()
         mem_baseline = get_memory_usage_mb()
         
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
-        # Process many times
+        # Process many times, with a fresh extractor each time so every run
+        # does the work instead of returning the cached result
         for _ in range(20):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text(pdf_path)
             assert result.status.value == "success"
         
         gc.collect()
@@ -220,24 +225,24 @@ class TestConcurrentProcessing:
         """Concurrent processing should not cause significant slowdown."""
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
-        # Time sequential processing
-        extractor = PDFExtractor()
-        start = time.time()
+        # Time sequential processing, with a fresh extractor per document so
+        # both branches do five real extractions rather than cache lookups
+        start = time.perf_counter()
         for _ in range(5):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text(pdf_path)
             assert result.status.value == "success"
-        sequential_time = time.time() - start
+        sequential_time = time.perf_counter() - start
         
         # Time concurrent processing
         def extract_pdf():
             extractor = PDFExtractor()
             return extractor.extract_text(pdf_path)
         
-        start = time.time()
+        start = time.perf_counter()
         with ThreadPoolExecutor(max_workers=5) as executor:
             futures = [executor.submit(extract_pdf) for _ in range(5)]
             results = [future.result() for future in as_completed(futures)]
-        concurrent_time = time.time() - start
+        concurrent_time = time.perf_counter() - start
         
         # Concurrent should be faster or similar (allow 2x overhead for thread management)
         assert concurrent_time < sequential_time * 2, \
@@ -272,7 +277,7 @@ class TestResourceCleanup:
     
     def test_file_handles_closed_properly(self):
         """File handles should be closed after extraction."""
-        process = psutil.Process(os.getpid())
+        process = _PROCESS
         
         # Get baseline file descriptor count
         open_files_before = len(process.open_files())
@@ -300,14 +305,14 @@ class TestResourceCleanup:
         text = "This is a test sentence. This is another sentence."
         
         # First call loads model
-        start = time.time()
+        start = time.perf_counter()
         result1 = segmenter1.segment_text(text)
-        time1 = time.time() - start
+        time1 = time.perf_counter() - start
         
         # Second call should reuse cached model
-        start = time.time()
+        start = time.perf_counter()
         result2 = segmenter2.segment_text(text)
-        time2 = time.time() - start
+        time2 = time.perf_counter() - start
         
         # Both should succeed
         assert result1.metadata.total_sentences == 2
@@ -320,7 +325,7 @@ class TestResourceCleanup:
     
     def test_resources_cleaned_on_error(self):
         """Resources should be cleaned up even on errors."""
-        process = psutil.Process(os.getpid())
+        process = _PROCESS
         open_files_before = len(process.open_files())
         
         extractor = PDFExtractor()
@@ -366,24 +371,25 @@ class TestPipelineThroughput:
     
     def test_batch_processing_efficiency(self):
         """Batch processing should be more efficient than individual processing."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         num_docs = 10
         
-        # Time individual processing
-        start = time.time()
+        # Time individual processing: a fresh extractor per document, so each
+        # one is a real extraction
+        start = time.perf_counter()
         for _ in range(num_docs):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text(pdf_path)
             assert result.status.value == "success"
-        individual_time = time.time() - start
+        individual_time = time.perf_counter() - start
         
-        # Time batch processing (simulated by reusing extractor instance)
-        start = time.time()
+        # Time batch processing (simulated by reusing extractor instance,
+        # whose result cache serves the repeats)
+        start = time.perf_counter()
         extractor_batch = PDFExtractor()
         for _ in range(num_docs):
             result = extractor_batch.extract_text(pdf_path)
             assert result.status.value == "success"
-        batch_time = time.time() - start
+        batch_time = time.perf_counter() - start
         
         # Batch should be similar or faster (caching benefits)
         # Allow significant variance due to test execution order and system load
@@ -396,14 +402,14 @@ class TestPipelineThroughput:
         text = "This is a test sentence. " * 50  # Repeated text
         
         # First segmentation (cold cache)
-        start = time.time()
+        start = time.perf_counter()
         result1 = segmenter.segment_text(text)
-        time1 = time.time() - start
+        time1 = time.perf_counter() - start
         
         # Second segmentation (warm cache)
-        start = time.time()
+        start = time.perf_counter()
         result2 = segmenter.segment_text(text)
-        time2 = time.time() - start
+        time2 = time.perf_counter() - start
         
         # Both should succeed
         assert result1.metadata.total_segments > 0
@@ -415,15 +421,15 @@ class TestPipelineThroughput:
     
     def test_overall_throughput(self):
         """Overall system throughput should meet requirements."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "clean_simple.pdf"
         
-        # Process 20 documents and measure throughput
-        start = time.time()
+        # Process 20 documents and measure throughput (a fresh extractor per
+        # document, so the result cache doesn't turn this into lookups)
+        start = time.perf_counter()
         for _ in range(20):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text(pdf_path)
             assert result.status.value == "success"
-        total_time = time.time() - start
+        total_time = time.perf_counter() - start
         
         # Calculate documents per minute
         docs_per_minute = (20 / total_time) * 60
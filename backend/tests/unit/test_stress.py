@@ -12,10 +12,14 @@ Test Philosophy:
 """
 
 import pytest
-import gc
+import asyncio
 import os
+import queue
+import re
+import statistics
+import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from app.services.pdf_extractor import PDFExtractor
 from app.services.pdf_segmenter import PDFSegmenter
 from app.services.pdf_cleaner import PDFCleaner
@@ -27,13 +31,33 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pdfs"
 # Mark all tests in this module as stress tests
 pytestmark = [pytest.mark.stress]
 
+# Runs of 4 or more spaces, which normalization should never leave behind
+_MULTISPACE = re.compile(r" {4,}")
+
+
+def _workers(n_tasks):
+    """Number of workers for n_tasks CPU-bound jobs: at most one per usable CPU."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS or Windows
+        cpus = os.cpu_count() or 1
+    return min(n_tasks, cpus)
+
+
+def _extract_status(pdf_path):
+    """Process-pool task: extract one PDF and return only its status value.
+    
+    Defined at module level so it can be pickled; returning the status string
+    instead of the full result keeps inter-process traffic small.
+    """
+    return PDFExtractor().extract_text(pdf_path).status.value
+
 
 class TestLargeDocuments:
     """Test handling of very large documents."""
     
-    def test_multipage_pdf_extraction(self):
+    def test_multipage_pdf_extraction(self, extractor):
         """Should handle multi-page PDFs efficiently."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"  # 5 pages
         
         result = extractor.extract_text(pdf_path)
@@ -44,9 +68,8 @@ class TestLargeDocuments:
         assert result.metadata.pages_extracted == 5
         assert result.metadata.pages_failed == 0
     
-    def test_complex_layout_pdf(self):
+    def test_complex_layout_pdf(self, extractor):
         """Should handle complex layouts without excessive time."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "complex_layout.pdf"
         
         import time
@@ -58,9 +81,8 @@ class TestLargeDocuments:
         assert elapsed < 5.0, f"Complex layout took {elapsed:.2f}s, expected <5s"
         assert result.status.value in ["success", "partial"]
     
-    def test_multi_column_pdf(self):
+    def test_multi_column_pdf(self, extractor):
         """Should handle multi-column layouts."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "multi_column.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -69,12 +91,14 @@ class TestLargeDocuments:
         assert result.status.value in ["success", "partial"]
         assert len(result.text) > 0
     
-    def test_large_text_segmentation(self):
+    @pytest.mark.parametrize("use_gpu", [False, True])
+    def test_large_text_segmentation(self, request, segmenter, long_sentences_text, use_gpu):
         """Should segment very long text efficiently."""
-        segmenter = PDFSegmenter()
-        
-        # Create very long text (simulate 50-page document)
-        text = " ".join([f"This is sentence number {i}." for i in range(1000)])
+        # Very long text (simulates a 50-page document)
+        text = long_sentences_text
+        if use_gpu:
+            # Requested here so the GPU probe only runs for this case
+            segmenter = request.getfixturevalue("gpu_segmenter")
         
         import time
         start = time.time()
@@ -86,12 +110,10 @@ class TestLargeDocuments:
         assert result.metadata.total_segments > 0
         assert result.metadata.total_sentences == 1000
     
-    def test_very_long_single_sentence(self):
+    def test_very_long_single_sentence(self, segmenter, long_single_sentence_text):
         """Should handle extremely long single sentences."""
-        segmenter = PDFSegmenter()
-        
-        # Create a very long sentence (10,000 words)
-        text = " ".join(["word"] * 10000) + "."
+        # A very long sentence (10,000 words)
+        text = long_single_sentence_text
         
         result = segmenter.segment_text(text)
         
@@ -107,9 +129,8 @@ class TestErrorIsolation:
     in test_pdf_extraction.py. This class focuses on error isolation behavior.
     """
     
-    def test_corrupted_pdf_doesnt_crash_pipeline(self):
+    def test_corrupted_pdf_doesnt_crash_pipeline(self, extractor):
         """Corrupted PDF should fail gracefully without crashing."""
-        extractor = PDFExtractor()
         
         # Try to extract from a non-PDF file
         try:
@@ -120,9 +141,8 @@ class TestErrorIsolation:
             # Should raise a specific exception, not crash
             assert isinstance(e, (FileNotFoundError, TypeError, ValueError))
     
-    def test_empty_pdf_handling(self):
+    def test_empty_pdf_handling(self, extractor):
         """Empty PDF should be handled gracefully."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "empty_pages.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -153,9 +173,8 @@ class TestErrorIsolation:
         assert result2.status.value == "success"
         assert result2.text == result1.text  # Should produce same result
     
-    def test_partial_extraction_on_page_failure(self):
+    def test_partial_extraction_on_page_failure(self, extractor):
         """Should continue extraction even if some pages fail."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -173,71 +192,81 @@ class TestMemoryPressure:
     This class focuses on more aggressive stress scenarios.
     """
     
-    def test_sequential_large_pdf_processing(self):
+    def test_sequential_large_pdf_processing(self, pdf_bytes_cache):
         """Should handle multiple large PDFs sequentially without memory issues."""
-        extractor = PDFExtractor()
-        pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
+        pdf_bytes = pdf_bytes_cache["pdf_with_noise.pdf"]
         
-        # Process 10 times sequentially
+        # Process 10 times sequentially, with a fresh extractor each time so
+        # every iteration is a real extraction rather than a cache hit
         for i in range(10):
-            result = extractor.extract_text(pdf_path)
+            result = PDFExtractor().extract_text_from_bytes(pdf_bytes)
             assert result.status.value == "success", f"Failed on iteration {i+1}"
-            
-            # Force garbage collection between iterations
-            gc.collect()
         
         # Should complete all iterations without memory errors
     
-    def test_concurrent_large_pdf_processing(self):
+    async def test_concurrent_large_pdf_processing(self, pool):
         """Should handle concurrent processing of large PDFs."""
         pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
         
-        def extract_pdf():
-            extractor = PDFExtractor()
-            return extractor.extract_text(pdf_path)
+        # One extractor shared by every task, as a server would hold it
+        extractor = PDFExtractor()
+        num_tasks = 5
+        semaphore = asyncio.Semaphore(_workers(num_tasks))
+        loop = asyncio.get_running_loop()
+        
+        async def extract_pdf():
+            async with semaphore:
+                return await loop.run_in_executor(pool, extractor.extract_text, pdf_path)
         
         # Process 5 PDFs concurrently
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(extract_pdf) for _ in range(5)]
-            results = [future.result() for future in as_completed(futures)]
+        results = await asyncio.gather(*(extract_pdf() for _ in range(num_tasks)))
         
         # All should succeed
         assert len(results) == 5
         for result in results:
             assert result.status.value == "success"
     
-    def test_segmentation_memory_efficiency(self):
+    def test_segmentation_memory_efficiency(self, request, warm_spacy_pipeline):
         """Segmentation should not use excessive memory."""
         import psutil
         process = psutil.Process(os.getpid())
         
-        segmenter = PDFSegmenter()
-        
         # Create large text
         text = " ".join([f"Sentence {i}." for i in range(5000)])
         
-        gc.collect()
+        # Warm-up run on a throwaway segmenter: spaCy's vocab and string
+        # store grow once per new token, which is not retained by the service
+        PDFSegmenter().segment_text(text)
+        
+        # Start tracing only now, so the warm-up isn't measured
+        service_heap_growth = request.getfixturevalue("service_heap_growth")
         mem_before = process.memory_info().rss / 1024 / 1024
         
+        segmenter = PDFSegmenter()
         result = segmenter.segment_text(text)
+        mem_used = process.memory_info().rss / 1024 / 1024 - mem_before
         
-        mem_after = process.memory_info().rss / 1024 / 1024
-        mem_used = mem_after - mem_before
+        # Drop the segmenter and its result cache; only the result remains
+        del segmenter
+        heap_used = service_heap_growth() / 1024 / 1024
         
         # Should segment successfully
         assert result.metadata.total_sentences == 5000
         
-        # Should not use excessive memory (<400MB for 5000 sentences including spaCy model)
-        # spaCy model itself takes ~150MB, plus processing overhead for large text (~200MB)
+        # Should not use excessive memory (<400MB for 5000 sentences); the
+        # spaCy model is already loaded, so this is processing overhead only
         assert mem_used < 400, f"Used {mem_used:.1f}MB for segmentation, expected <400MB"
+        
+        # Python objects still held after segmentation (spaCy's included)
+        # should be little more than the result itself
+        assert heap_used < 10, f"Segmentation kept {heap_used:.1f}MB of heap, expected <10MB"
 
 
 class TestEdgeCases:
     """Test extreme edge cases."""
     
-    def test_pdf_with_only_images(self):
+    def test_pdf_with_only_images(self, extractor):
         """PDF with only images should not crash."""
-        extractor = PDFExtractor()
         # Use a PDF that might have minimal text
         pdf_path = FIXTURES_DIR / "empty_pages.pdf"
         
@@ -247,9 +276,8 @@ class TestEdgeCases:
         assert result.status.value in ["success", "partial", "failed"]
         # Text may be empty, but should not crash
     
-    def test_empty_text_segmentation(self):
+    def test_empty_text_segmentation(self, segmenter):
         """Empty text should be handled gracefully."""
-        segmenter = PDFSegmenter()
         
         result = segmenter.segment_text("")
         
@@ -257,18 +285,16 @@ class TestEdgeCases:
         assert result.metadata.total_segments == 0
         assert len(result.segments) == 0
     
-    def test_whitespace_only_text(self):
+    def test_whitespace_only_text(self, segmenter):
         """Whitespace-only text should be handled."""
-        segmenter = PDFSegmenter()
         
         result = segmenter.segment_text("   \n\n   \t\t   ")
         
         # Should return empty result
         assert result.metadata.total_segments == 0
     
-    def test_special_characters_in_text(self):
+    def test_special_characters_in_text(self, extractor):
         """Text with special characters should be processed correctly."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "encoding_issues.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -276,9 +302,8 @@ class TestEdgeCases:
         # Should handle encoding issues gracefully
         assert result.status.value in ["success", "partial"]
     
-    def test_mixed_content_pdf(self):
+    def test_mixed_content_pdf(self, extractor):
         """PDF with mixed content (text, images, tables) should be processed."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "mixed_content.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -287,9 +312,8 @@ class TestEdgeCases:
         assert result.status.value in ["success", "partial"]
         assert len(result.text) > 0
     
-    def test_excessive_whitespace_handling(self):
+    def test_excessive_whitespace_handling(self, extractor):
         """PDF with excessive whitespace should be normalized."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "excessive_whitespace.pdf"
         
         result = extractor.extract_text(pdf_path)
@@ -297,34 +321,36 @@ class TestEdgeCases:
         # Should normalize whitespace
         assert result.status.value == "success"
         # Should not have excessive consecutive spaces
-        assert "    " not in result.text  # No 4+ consecutive spaces
+        match = _MULTISPACE.search(result.text)
+        assert match is None, f"Excessive whitespace at offset {match.start()}"
     
-    def test_very_small_text_blocks(self):
+    def test_very_small_text_blocks(self, extractor):
         """Should handle PDFs with many small text blocks."""
-        extractor = PDFExtractor()
         pdf_path = FIXTURES_DIR / "complex_layout.pdf"
         
         result = extractor.extract_text(pdf_path)
         
         # Should process all text blocks
         assert result.status.value in ["success", "partial"]
-        total_blocks = sum(len(page.text_blocks) for page in result.pages)
-        assert total_blocks > 0
+        assert result.total_text_blocks > 0
 
 
 class TestRobustness:
     """Test overall system robustness."""
     
-    def test_repeated_processing_stability(self):
+    def test_repeated_processing_stability(self, pdf_bytes_cache):
         """System should remain stable over repeated processing."""
-        extractor = PDFExtractor()
-        segmenter = PDFSegmenter()
-        pdf_path = FIXTURES_DIR / "clean_simple.pdf"
+        pdf_bytes = pdf_bytes_cache["clean_simple.pdf"]
         
         # Process 50 times
         for i in range(50):
+            # Fresh instances, so the result caches can't turn the repeated
+            # work into lookups (the spaCy pipeline is still shared)
+            extractor = PDFExtractor()
+            segmenter = PDFSegmenter()
+            
             # Extract
-            extraction_result = extractor.extract_text(pdf_path)
+            extraction_result = extractor.extract_text_from_bytes(pdf_bytes)
             assert extraction_result.status.value == "success", f"Extraction failed on iteration {i+1}"
             
             # Segment
@@ -333,6 +359,31 @@ class TestRobustness:
         
         # Should complete all iterations without degradation
     
+    @pytest.mark.slow
+    def test_no_latency_growth(self, warm_spacy_pipeline):
+        """Processing time should not grow over repeated runs."""
+        pdf_path = FIXTURES_DIR / "clean_simple.pdf"
+        iterations = 50
+        window = 10
+        
+        latencies = []
+        for _ in range(iterations):
+            # Fresh instances so every run does the work rather than hitting
+            # a result cache (the spaCy pipeline is still shared)
+            start = time.perf_counter()
+            extraction_result = PDFExtractor().extract_text(pdf_path)
+            PDFSegmenter().segment_text(extraction_result.text)
+            latencies.append(time.perf_counter() - start)
+        
+        # Medians of the first and last runs ignore one-off stalls on a busy
+        # machine; only a sustained slowdown doubles the late median
+        early = statistics.median(latencies[:window])
+        late = statistics.median(latencies[-window:])
+        assert late < 2 * early, (
+            f"Median latency grew from {early * 1000:.1f}ms to {late * 1000:.1f}ms "
+            f"over {iterations} runs"
+        )
+    
     def test_error_recovery(self):
         """System should recover from errors and continue processing."""
         extractor = PDFExtractor()
@@ -370,33 +421,53 @@ class TestRobustness:
             FIXTURES_DIR / "mixed_content.pdf",
         ]
         
-        def extract_pdf(pdf_path):
-            extractor = PDFExtractor()
-            return extractor.extract_text(pdf_path)
-        
-        # Process all concurrently
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(extract_pdf, pdf) for pdf in pdfs]
-            results = [future.result() for future in as_completed(futures)]
+        # Process all concurrently, in separate processes so parsing isn't
+        # serialized by the GIL
+        with ProcessPoolExecutor(max_workers=_workers(len(pdfs))) as executor:
+            futures = [executor.submit(_extract_status, pdf) for pdf in pdfs]
+            statuses = [future.result() for future in as_completed(futures)]
         
         # All should complete (success or partial)
-        assert len(results) == 5
-        for result in results:
-            assert result.status.value in ["success", "partial"]
+        assert len(statuses) == 5
+        for status in statuses:
+            assert status in ["success", "partial"]
     
-    def test_graceful_degradation(self):
+    def test_graceful_degradation(self, pdf_bytes_cache, pool):
         """System should degrade gracefully under stress."""
-        extractor = PDFExtractor()
-        pdf_path = FIXTURES_DIR / "pdf_with_noise.pdf"
-        
-        # Process many documents rapidly
-        results = []
+        pdf_bytes = pdf_bytes_cache["pdf_with_noise.pdf"]
+        num_consumers = 4
+        
+        # A bounded queue makes the producer wait for the consumers, as an
+        # upload queue in front of the extraction workers would
+        tasks = queue.Queue(maxsize=num_consumers)
+        
+        def consume():
+            consumed = []
+            while (data := tasks.get()) is not None:
+                try:
+                    # A fresh extractor per task, so every task is a real
+                    # extraction rather than a content-cache hit
+                    consumed.append(PDFExtractor().extract_text_from_bytes(data))
+                except Exception as e:
+                    # Keep draining so the producer never blocks forever
+                    consumed.append(e)
+            return consumed
+        
+        consumers = [pool.submit(consume) for _ in range(num_consumers)]
+        
+        # Process many documents rapidly, then one stop marker per consumer
         for _ in range(20):
-            result = extractor.extract_text(pdf_path)
-            results.append(result)
+            tasks.put(pdf_bytes)
+        for _ in range(num_consumers):
+            tasks.put(None)
+        
+        results = [result for future in as_completed(consumers) for result in future.result()]
         
         # Most should succeed
-        successful = [r for r in results if r.status.value == "success"]
+        successful = [
+            r for r in results
+            if not isinstance(r, Exception) and r.status.value == "success"
+        ]
         assert len(successful) >= 18, "Too many failures under load"
         
         # All should complete (no hangs or crashes)